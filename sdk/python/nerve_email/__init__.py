@@ -1,4 +1,6 @@
 """nerve-email -- Python SDK for Nerve MCP email server."""
+import asyncio
+import sys
 
 from .client import NerveClient
 from .admin import NerveAdmin
@@ -20,6 +22,29 @@ __all__ = [
     "NerveRateLimitError",
     "NerveQuotaError",
     "NerveSubscriptionError",
+    "install_fast_loop",
 ]
 
 __version__ = "0.1.0"
+
+
+def install_fast_loop() -> bool:
+    """Install uvloop as the asyncio event loop policy, if available.
+
+    Call once at startup, before asyncio.run():
+
+        import nerve_email
+        nerve_email.install_fast_loop()
+        asyncio.run(main())
+
+    Requires the "fast" extra (pip install nerve-email[fast]). Returns True
+    if uvloop was installed, False on Windows or when uvloop is missing.
+    """
+    if sys.platform == "win32":
+        return False
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
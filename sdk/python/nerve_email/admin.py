@@ -26,6 +26,12 @@ import httpx
 
 from .exceptions import NerveError, NerveAuthError
 
+_HTTP_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=30.0,
+)
+
 
 class NerveAdmin:
     """Control plane client for Nerve domain and inbox management.
@@ -33,15 +39,20 @@ class NerveAdmin:
     Uses X-API-Key (bootstrap admin key) for authentication.
     """
 
+    __slots__ = ("base_url", "_api_key", "_timeout", "_transport", "_http")
+
     def __init__(
         self,
         base_url: str,
         api_key: str,
         timeout: float = 30.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
     ):
         self.base_url = base_url.rstrip("/")
         self._api_key = api_key
         self._timeout = timeout
+        # Replaces the default HTTP/2 transport when given
+        self._transport = transport
         self._http: Optional[httpx.AsyncClient] = None
 
     async def __aenter__(self):
@@ -54,11 +65,11 @@ class NerveAdmin:
         if self._http is None or self._http.is_closed:
             self._http = httpx.AsyncClient(
                 base_url=self.base_url,
-                headers={
-                    "Content-Type": "application/json",
-                    "X-API-Key": self._api_key,
-                },
+                headers={"X-API-Key": self._api_key},
                 timeout=self._timeout,
+                transport=self._transport or httpx.AsyncHTTPTransport(
+                    http2=True, limits=_HTTP_LIMITS, retries=0,
+                ),
             )
         return self._http
 
@@ -20,13 +20,33 @@ Usage:
 
         # Dynamic tool discovery (prevents schema drift)
         server_tools = await client.list_tools()
+
+    # Start the MCP handshake on entry so it overlaps with caller setup
+    async with NerveClient(base_url=..., api_key=..., prefetch_session=True) as client:
+        ...
+
+    # Route requests through a custom transport (e.g. httpx.MockTransport in tests)
+    async with NerveClient(base_url=..., api_key=..., transport=transport) as client:
+        ...
 """
 import asyncio
+import enum
+import itertools
 import logging
-from typing import Any, Dict, List, Optional
+import random
+import sys
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
 
 import httpx
+import orjson
+
+try:
+    import ijson
+except ImportError:  # optional "stream" extra
+    ijson = None
 
+from .concurrency import AIMDLimiter
 from .exceptions import (
     NerveError, NerveSessionError, NerveRateLimitError,
     NerveQuotaError, NerveAuthError, NerveSubscriptionError,
@@ -39,18 +59,209 @@ _MCP_PROTOCOL_VERSION = "2025-11-25"
 _CLIENT_NAME = "nerve-email-python"
 _CLIENT_VERSION = "0.1.0"
 
+# Tool names, interned so lookups against them can match on identity
+_TOOL_LIST_THREADS = sys.intern("list_threads")
+_TOOL_GET_THREAD = sys.intern("get_thread")
+_TOOL_SEARCH_INBOX = sys.intern("search_inbox")
+_TOOL_TRIAGE_MESSAGE = sys.intern("triage_message")
+_TOOL_EXTRACT_TO_SCHEMA = sys.intern("extract_to_schema")
+_TOOL_DRAFT_REPLY = sys.intern("draft_reply_with_policy")
+_TOOL_SEND_REPLY = sys.intern("send_reply")
+_TOOL_COMPOSE_EMAIL = sys.intern("compose_email")
+
 # Tools that are NOT safe to retry (non-idempotent)
-_NON_IDEMPOTENT_TOOLS = frozenset({"send_reply", "compose_email"})
+_NON_IDEMPOTENT_TOOLS = frozenset({_TOOL_SEND_REPLY, _TOOL_COMPOSE_EMAIL})
+
+# Connection pool sizing. With HTTP/2, concurrent tool calls multiplex
+# over a single warm TLS connection instead of opening new ones.
+_HTTP_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=30.0,
+)
+
+
+# Non-retryable JSON-RPC error codes with a dedicated exception type
+_ERROR_TYPES = {
+    -32040: NerveQuotaError,  # quota_exceeded
+    -32041: NerveSubscriptionError,  # subscription_inactive
+}
+
+# Rate-limit backoff: each retry waits retry_after * 1.5**attempt, stretched
+# by up to 50% random jitter so concurrent clients don't retry in lockstep.
+_BACKOFF_FACTOR = 1.5
+_BACKOFF_JITTER = 0.5
+
+
+def _error_from_rpc(err: Dict[str, Any]) -> NerveError:
+    """Map a JSON-RPC error object to the SDK exception taxonomy."""
+    code = err.get("code", 0)
+    msg = err.get("message", "unknown error")
+    if code == -32042:  # rate_limited
+        retry_after = (err.get("data") or {}).get("retry_after_seconds", 2)
+        return NerveRateLimitError(msg, retry_after=retry_after)
+    error_type = _ERROR_TYPES.get(code)
+    if error_type is not None:
+        return error_type(msg)
+    return NerveError(msg, code=code)
+
+
+def _raise_for_auth(resp: httpx.Response):
+    """Raise NerveAuthError for a 401/403 response."""
+    if resp.status_code == 401:
+        raise NerveAuthError("Authentication failed -- check API key or token")
+    if resp.status_code == 403:
+        raise NerveAuthError("Forbidden -- check API key scopes")
+
+
+def _json_or_none(resp: httpx.Response) -> Any:
+    try:
+        return orjson.loads(resp.content)
+    except orjson.JSONDecodeError:
+        return None
+
+
+def _error_from_http(resp: httpx.Response) -> NerveError:
+    """Map a failed (>= 400) HTTP response whose body has been read.
+
+    A JSON-RPC error object in the body takes precedence; otherwise the
+    status code is reported.
+    """
+    data = _json_or_none(resp)
+    if isinstance(data, dict) and isinstance(data.get("error"), dict):
+        return _error_from_rpc(data["error"])
+    msg = f"HTTP {resp.status_code} from {resp.url.path}"
+    if resp.status_code == 429:
+        try:
+            retry_after = float(resp.headers.get("Retry-After", 2))
+        except ValueError:  # HTTP-date form
+            retry_after = 2.0
+        return NerveRateLimitError(msg, retry_after=retry_after)
+    return NerveError(msg, code=resp.status_code)
+
+
+# JSON-RPC replies meaning the server could not parse the batch as a request
+_BATCH_REJECTED_CODES = frozenset({-32600, -32700})
+
+
+def _batch_rejected(resp: httpx.Response, data: Any) -> bool:
+    """True when a batch POST was refused as unsupported rather than failed."""
+    if resp.status_code == 400:
+        return True
+    error = data.get("error") if isinstance(data, dict) else None
+    return isinstance(error, dict) and error.get("code") in _BATCH_REJECTED_CODES
+
+
+class _ErrorAction(enum.Enum):
+    """What _rpc does after an error handler runs."""
+    RETRY = enum.auto()
+    RAISE = enum.auto()
+
+
+async def _on_rate_limited(client, err, attempt, can_retry, headers) -> _ErrorAction:
+    """-32042: back off from the server's retry hint, then retry."""
+    client._limiter.on_overload()
+    if not can_retry:
+        return _ErrorAction.RAISE
+    retry_after = (err.get("data") or {}).get("retry_after_seconds", 2)
+    delay = retry_after * client._backoff[attempt] * (1 + random.random() * _BACKOFF_JITTER)
+    logger.warning("Rate limited, retrying in %.2fs", delay)
+    await asyncio.sleep(delay)
+    return _ErrorAction.RETRY
+
+
+async def _on_server_error(client, err, attempt, can_retry, headers) -> _ErrorAction:
+    """-32000: re-initialize when the session this request used has expired."""
+    # Requests sent without a session (initialize) have nothing to recover
+    if not headers or "session" not in err.get("message", "").lower():
+        return _ErrorAction.RAISE
+    # Only drop the session if a concurrent call hasn't already replaced it
+    if headers is client._session_headers:
+        client._set_session(None)
+    await client._ensure_session()
+    return _ErrorAction.RETRY
+
+
+# Recoverable JSON-RPC error codes; anything else raises via _error_from_rpc
+_ERR_HANDLERS = {
+    -32042: _on_rate_limited,  # rate_limited
+    -32000: _on_server_error,  # generic server error (may be session expiry)
+}
+
+
+class _AsyncByteReader:
+    """Adapts an async byte-chunk iterator to the read() interface ijson expects."""
+
+    def __init__(self, chunks: AsyncIterator[bytes]):
+        self._chunks = chunks
+
+    async def read(self, size: int = -1) -> bytes:
+        if size == 0:  # ijson probes the stream type with read(0)
+            return b""
+        try:
+            return await self._chunks.__anext__()
+        except StopAsyncIteration:
+            return b""
+
+
+async def _iter_json_items(events, prefixes) -> AsyncIterator[Tuple[str, Any]]:
+    """Yield (prefix, value) for each JSON value found at one of prefixes.
+
+    Values are assembled from ijson parse events one at a time, so only the
+    current item is ever held in memory.
+    """
+    async for prefix, event, value in events:
+        if prefix not in prefixes:
+            continue
+        if event not in ("start_map", "start_array"):
+            yield prefix, value
+            continue
+        builder = ijson.ObjectBuilder()
+        builder.event(event, value)
+        depth = 1
+        while depth:
+            _, event, value = await events.__anext__()
+            builder.event(event, value)
+            if event in ("start_map", "start_array"):
+                depth += 1
+            elif event in ("end_map", "end_array"):
+                depth -= 1
+        yield prefix, builder.value
 
 
 class NerveClient:
     """Async MCP client for Nerve email server.
 
     Supports both API key and bearer token authentication.
-    Thread-safe for concurrent async usage thanks to asyncio.Lock
-    on session initialization.
+    Safe for concurrent async usage: parallel calls on a fresh client
+    share a single session initialize, and in-flight requests are capped
+    by an AIMD limiter (up to max_concurrency) that backs off when the
+    server rate-limits or returns 5xx.
     """
 
+    __slots__ = (
+        "base_url",
+        "_api_key",
+        "_bearer_token",
+        "_timeout",
+        "_max_retries",
+        "_backoff",
+        "_limiter",
+        "_session_id",
+        "_session_headers",
+        "_session_ready",
+        "_id_iter",
+        "_http",
+        "_batch_supported",
+        "_tools_cache_ttl",
+        "_tools_cache",
+        "_inboxes_cache_ttl",
+        "_inboxes_cache",
+        "_prefetch_session",
+        "_prefetch_task",
+        "_transport",
+    )
+
     def __init__(
         self,
         base_url: str,
@@ -58,18 +269,57 @@ class NerveClient:
         bearer_token: Optional[str] = None,
         timeout: float = 30.0,
         max_retries: int = 3,
+        max_concurrency: int = 64,
+        target_latency: float = 5.0,
+        tools_cache_ttl: float = 300.0,
+        inboxes_cache_ttl: float = 30.0,
+        prefetch_session: bool = False,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
     ):
         self.base_url = base_url.rstrip("/")
         self._api_key = api_key
         self._bearer_token = bearer_token
         self._timeout = timeout
         self._max_retries = max_retries
+        self._backoff = tuple(_BACKOFF_FACTOR ** i for i in range(max_retries))
+        # Adaptive cap on in-flight requests; shrinks when the server pushes back
+        self._limiter = AIMDLimiter(
+            initial_limit=min(8, max_concurrency),
+            max_limit=max_concurrency,
+            target_latency=target_latency,
+        )
         self._session_id: Optional[str] = None
-        self._session_lock = asyncio.Lock()  # Prevents concurrent initialize races
-        self._request_id = 0
+        # Per-request MCP headers, rebuilt only when the session changes
+        self._session_headers: Dict[str, str] = {}
+        # Set while an initialize is in flight; concurrent callers wait on it
+        self._session_ready: Optional[asyncio.Event] = None
+        self._id_iter = itertools.count(1)
         self._http: Optional[httpx.AsyncClient] = None
+        self._batch_supported = True  # Cleared if the server rejects batch POSTs
+        # Discovery caches: (monotonic timestamp, value)
+        self._tools_cache_ttl = tools_cache_ttl
+        self._tools_cache: Optional[Tuple[float, List[Dict[str, Any]]]] = None
+        self._inboxes_cache_ttl = inboxes_cache_ttl
+        self._inboxes_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._prefetch_session = prefetch_session
+        self._prefetch_task: Optional[asyncio.Task] = None
+        # Replaces the default HTTP/2 transport when given
+        self._transport = transport
+
+    @classmethod
+    def _for_tests(cls, *, session_id: str = "test-session-123", **kwargs) -> "NerveClient":
+        """Build a client whose MCP session is already established.
+
+        Test-only: skips the initialize handshake, so only the calls under
+        test reach the (mocked) server.
+        """
+        client = cls(**kwargs)
+        client._set_session(session_id)
+        return client
 
     async def __aenter__(self):
+        if self._prefetch_session and not self._session_id:
+            self._prefetch_task = asyncio.ensure_future(self._prefetch())
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -77,6 +327,7 @@ class NerveClient:
 
     async def _get_http(self) -> httpx.AsyncClient:
         if self._http is None or self._http.is_closed:
+            # Bodies are pre-encoded with orjson, so Content-Type is explicit
             headers = {
                 "Content-Type": "application/json",
                 "MCP-Protocol-Version": _MCP_PROTOCOL_VERSION,
@@ -89,34 +340,57 @@ class NerveClient:
                 base_url=self.base_url,
                 headers=headers,
                 timeout=self._timeout,
+                transport=self._transport or httpx.AsyncHTTPTransport(
+                    http2=True, limits=_HTTP_LIMITS, retries=0,
+                ),
             )
         return self._http
 
+    async def _prefetch(self):
+        """Background initialize started by __aenter__ (prefetch_session=True).
+
+        The first tool call joins the in-flight initialize instead of paying
+        a full handshake round-trip first. Failures are left for that call
+        to hit again and raise.
+        """
+        try:
+            await self._ensure_session()
+        except Exception:
+            logger.debug("MCP session prefetch failed", exc_info=True)
+
     async def _ensure_session(self):
         """Initialize MCP session if not already established.
 
-        Uses asyncio.Lock to prevent concurrent requests from
-        triggering multiple simultaneous initialize calls.
+        The first caller sends initialize; concurrent callers wait on an
+        asyncio.Event rather than queueing on a lock. If initialize fails,
+        each waiter retries it in turn and sees the actual error.
         """
-        if self._session_id:
-            return
-        async with self._session_lock:
-            # Double-check after acquiring lock (another coroutine may have initialized)
-            if self._session_id:
-                return
-            result = await self._rpc("initialize", {
-                "clientInfo": {
-                    "name": _CLIENT_NAME,
-                    "version": _CLIENT_VERSION,
-                },
-                "protocolVersion": _MCP_PROTOCOL_VERSION,
-            })
+        while not self._session_id:
+            ready = self._session_ready
+            if ready is not None:
+                await ready.wait()
+                continue
+            ready = self._session_ready = asyncio.Event()
+            try:
+                await self._rpc("initialize", {
+                    "clientInfo": {
+                        "name": _CLIENT_NAME,
+                        "version": _CLIENT_VERSION,
+                    },
+                    "protocolVersion": _MCP_PROTOCOL_VERSION,
+                })
+            finally:
+                self._session_ready = None
+                ready.set()
             if not self._session_id:
                 raise NerveSessionError("Server did not return MCP-Session-Id")
 
+    def _set_session(self, session_id: Optional[str]):
+        self._session_id = session_id
+        self._session_headers = {"MCP-Session-Id": session_id} if session_id else {}
+
     def _next_id(self) -> int:
-        self._request_id += 1
-        return self._request_id
+        return next(self._id_iter)
 
     async def _rpc(self, method: str, params: dict, *, allow_retry: bool = True) -> Any:
         """Send a JSON-RPC 2.0 request to Nerve's MCP endpoint.
@@ -127,59 +401,45 @@ class NerveClient:
             allow_retry: If False, do not retry on rate limit (for non-idempotent ops)
         """
         http = await self._get_http()
-        body = {
+        body = orjson.dumps({
             "jsonrpc": _JSONRPC_VERSION,
             "id": self._next_id(),
             "method": method,
             "params": params,
-        }
-        headers: Dict[str, str] = {}
-        if self._session_id:
-            headers["MCP-Session-Id"] = self._session_id
+        })
+        headers = self._session_headers
 
         max_attempts = (self._max_retries + 1) if allow_retry else 1
 
         for attempt in range(max_attempts):
-            resp = await http.post("/mcp", json=body, headers=headers)
+            async with self._limiter:
+                started = time.monotonic()
+                resp = await http.post("/mcp", content=body, headers=headers)
+            latency = time.monotonic() - started
 
-            if resp.status_code == 401:
-                raise NerveAuthError("Authentication failed -- check API key or token")
-            if resp.status_code == 403:
-                raise NerveAuthError("Forbidden -- check API key scopes")
+            if resp.status_code == 429 or resp.status_code >= 500:
+                self._limiter.on_overload()
+            _raise_for_auth(resp)
 
-            data = resp.json()
+            data = orjson.loads(resp.content)
 
             # Capture session ID from initialize response
             if method == "initialize" and "MCP-Session-Id" in resp.headers:
-                self._session_id = resp.headers["MCP-Session-Id"]
-
-            if "error" in data and data["error"]:
-                err = data["error"]
-                code = err.get("code", 0)
-                msg = err.get("message", "unknown error")
-                err_data = err.get("data", {})
-
-                if code == -32042:  # rate_limited (retryable)
-                    retry_after = err_data.get("retry_after_seconds", 2)
-                    if allow_retry and attempt < max_attempts - 1:
-                        logger.warning(f"Rate limited, retrying in {retry_after}s")
-                        await asyncio.sleep(retry_after)
-                        continue
-                    raise NerveRateLimitError(msg, retry_after=retry_after)
-                elif code == -32040:  # quota_exceeded (non-retryable)
-                    raise NerveQuotaError(msg)
-                elif code == -32041:  # subscription_inactive (non-retryable)
-                    raise NerveSubscriptionError(msg)
-                elif code == -32000 and "session" in msg.lower():
-                    # Session expired -- re-initialize under lock
-                    self._session_id = None
-                    await self._ensure_session()
-                    headers["MCP-Session-Id"] = self._session_id
+                self._set_session(resp.headers["MCP-Session-Id"])
+
+            err = data.get("error")
+            if not err:
+                self._limiter.on_success(latency)
+                return data.get("result")
+
+            handler = _ERR_HANDLERS.get(err.get("code", 0))
+            if handler is not None:
+                can_retry = allow_retry and attempt < max_attempts - 1
+                action = await handler(self, err, attempt, can_retry, headers)
+                if action is _ErrorAction.RETRY:
+                    headers = self._session_headers
                     continue
-                else:
-                    raise NerveError(msg, code=code)
-
-            return data.get("result")
+            raise _error_from_rpc(err)
 
         raise NerveError("Max retries exceeded")
 
@@ -217,11 +477,22 @@ class NerveClient:
         """Discover available tools from the server via tools/list.
 
         Prevents schema drift -- compare against static definitions
-        to detect breaking server changes.
+        to detect breaking server changes. The result is cached for
+        tools_cache_ttl seconds; use invalidate_tools_cache() to force
+        re-discovery.
         """
+        cached = self._tools_cache
+        if cached is not None and time.monotonic() - cached[0] < self._tools_cache_ttl:
+            return list(cached[1])
         await self._ensure_session()
         result = await self._rpc("tools/list", {})
-        return result.get("tools", [])
+        tools = result.get("tools", [])
+        self._tools_cache = (time.monotonic(), tools)
+        return list(tools)
+
+    def invalidate_tools_cache(self):
+        """Drop the cached tools/list result so the next list_tools() refetches."""
+        self._tools_cache = None
 
     # ------------------------------------------------------------------
     # Typed tool methods
@@ -239,15 +510,86 @@ class NerveClient:
         Returns dict with 'threads' list and optional 'next_cursor'
         for fetching subsequent pages.
         """
-        args: Dict[str, Any] = {"inbox_id": inbox_id, "limit": limit}
-        if status:
-            args["status"] = status
-        if cursor:
-            args["cursor"] = cursor
-        return await self._call_tool("list_threads", args)
+        args = {
+            k: v
+            for k, v in (("inbox_id", inbox_id), ("limit", limit), ("status", status), ("cursor", cursor))
+            if v is not None
+        }
+        return await self._call_tool(_TOOL_LIST_THREADS, args)
 
     async def get_thread(self, thread_id: str) -> Dict[str, Any]:
-        return await self._call_tool("get_thread", {"thread_id": thread_id})
+        return await self._call_tool(_TOOL_GET_THREAD, {"thread_id": thread_id})
+
+    async def iter_thread_messages(self, thread_id: str) -> AsyncIterator[Dict[str, Any]]:
+        """Yield a thread's messages one by one as the response streams in.
+
+        For large threads: unlike get_thread(), the response body is parsed
+        incrementally and never held in memory as a whole. Requires ijson
+        (pip install nerve-email[stream]). Expired sessions and rate
+        limits are retried as in get_thread(), which is safe because a
+        JSON-RPC error arrives before any message is yielded.
+        """
+        if ijson is None:
+            raise ImportError("iter_thread_messages requires ijson: pip install nerve-email[stream]")
+        params = {"name": _TOOL_GET_THREAD, "arguments": {"thread_id": thread_id}}
+        max_attempts = self._max_retries + 1
+        for attempt in range(max_attempts):
+            await self._ensure_session()
+            http = await self._get_http()
+            headers = self._session_headers
+            request = http.build_request(
+                "POST",
+                "/mcp",
+                content=orjson.dumps({
+                    "jsonrpc": _JSONRPC_VERSION,
+                    "id": self._next_id(),
+                    "method": "tools/call",
+                    "params": params,
+                }),
+                headers=headers,
+            )
+            # The limiter slot covers sending and the response headers only.
+            # Holding it across yields would deadlock a caller that makes
+            # another client call from inside its loop.
+            async with self._limiter:
+                started = time.monotonic()
+                resp = await http.send(request, stream=True)
+            latency = time.monotonic() - started
+            err = None
+            try:
+                if resp.status_code == 429 or resp.status_code >= 500:
+                    self._limiter.on_overload()
+                _raise_for_auth(resp)
+                if resp.status_code >= 400:
+                    await resp.aread()
+                    raise _error_from_http(resp)
+                events = ijson.parse_async(
+                    _AsyncByteReader(resp.aiter_bytes()), use_float=True
+                ).__aiter__()
+                async for prefix, value in _iter_json_items(
+                    events, ("result.messages.item", "error")
+                ):
+                    if prefix != "error":
+                        yield value
+                        continue
+                    err = value
+                    break
+            finally:
+                await resp.aclose()
+            if err is None:
+                self._limiter.on_success(latency)
+                return
+
+            # Handled with the stream closed; backoff must not hold a connection
+            handler = _ERR_HANDLERS.get(err.get("code", 0))
+            if handler is not None:
+                can_retry = attempt < max_attempts - 1
+                action = await handler(self, err, attempt, can_retry, headers)
+                if action is _ErrorAction.RETRY:
+                    continue
+            raise _error_from_rpc(err)
+
+        raise NerveError("Max retries exceeded")
 
     async def search_inbox(
         self,
@@ -257,19 +599,21 @@ class NerveClient:
         cursor: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Semantic search with pagination support."""
-        args: Dict[str, Any] = {"inbox_id": inbox_id, "query": query, "top_k": top_k}
-        if cursor:
-            args["cursor"] = cursor
-        return await self._call_tool("search_inbox", args)
+        args = {
+            k: v
+            for k, v in (("inbox_id", inbox_id), ("query", query), ("top_k", top_k), ("cursor", cursor))
+            if v is not None
+        }
+        return await self._call_tool(_TOOL_SEARCH_INBOX, args)
 
     async def triage_message(self, message_id: str) -> Dict[str, Any]:
-        return await self._call_tool("triage_message", {"message_id": message_id})
+        return await self._call_tool(_TOOL_TRIAGE_MESSAGE, {"message_id": message_id})
 
     async def extract_to_schema(
         self, message_id: str, schema_id: str
     ) -> Dict[str, Any]:
         return await self._call_tool(
-            "extract_to_schema", {"message_id": message_id, "schema_id": schema_id}
+            _TOOL_EXTRACT_TO_SCHEMA, {"message_id": message_id, "schema_id": schema_id}
         )
 
     async def draft_reply(
@@ -285,10 +629,12 @@ class NerveClient:
             goal: What the reply should accomplish
             attachments: Reserved for future use. Not supported in MVP.
         """
-        args: Dict[str, Any] = {"thread_id": thread_id, "goal": goal}
-        if attachments:
-            args["attachments"] = attachments
-        return await self._call_tool("draft_reply_with_policy", args)
+        args = {
+            k: v
+            for k, v in (("thread_id", thread_id), ("goal", goal), ("attachments", attachments))
+            if v is not None
+        }
+        return await self._call_tool(_TOOL_DRAFT_REPLY, args)
 
     async def send_reply(
         self,
@@ -306,7 +652,7 @@ class NerveClient:
                 user has already confirmed in the conversation UI.
         """
         return await self._call_tool(
-            "send_reply",
+            _TOOL_SEND_REPLY,
             {
                 "thread_id": thread_id,
                 "body_or_draft_id": body_or_draft_id,
@@ -333,7 +679,7 @@ class NerveClient:
             dict with thread_id, message_id, status
         """
         return await self._call_tool(
-            "compose_email",
+            _TOOL_COMPOSE_EMAIL,
             {
                 "inbox_id": inbox_id,
                 "to": to,
@@ -343,9 +689,24 @@ class NerveClient:
         )
 
     async def list_inboxes(self) -> Dict[str, Any]:
-        """Read the email://inboxes resource."""
+        """Read the email://inboxes resource.
+
+        Cached for inboxes_cache_ttl seconds; use invalidate_inboxes_cache()
+        after creating or deleting inboxes.
+        """
+        cached = self._inboxes_cache
+        if cached is not None and time.monotonic() - cached[0] < self._inboxes_cache_ttl:
+            return dict(cached[1])
         await self._ensure_session()
-        return await self._rpc("resources/read", {"uri": "email://inboxes"})
+        result = await self._rpc("resources/read", {"uri": "email://inboxes"})
+        if result is None:  # "result": null is passed through, not cached
+            return None
+        self._inboxes_cache = (time.monotonic(), result)
+        return dict(result)
+
+    def invalidate_inboxes_cache(self):
+        """Drop the cached email://inboxes result."""
+        self._inboxes_cache = None
 
     # ------------------------------------------------------------------
     # Generic tool execution (for agentic use)
@@ -355,6 +716,130 @@ class NerveClient:
         """Execute any MCP tool by name. Used by agentic frameworks."""
         return await self._call_tool(tool_name, arguments)
 
+    # ------------------------------------------------------------------
+    # Batch execution
+    # ------------------------------------------------------------------
+
+    async def batch(
+        self,
+        calls: Sequence[Tuple[str, dict]],
+        *,
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """Execute several tool calls in a single JSON-RPC batch POST.
+
+        Results are returned in call order. Batch entries are never
+        retried; an entry that fails raises its mapped NerveError (or is
+        returned in place when return_exceptions=True), and a failed POST
+        (429, 5xx, a top-level JSON-RPC error) raises without re-sending
+        anything.
+
+        If the server rejects batches as unsupported (HTTP 400, or a
+        -32600/-32700 reply), nothing was dispatched: the calls are sent
+        concurrently as individual requests instead, and batching is not
+        attempted again on this client.
+
+        Args:
+            calls: (tool_name, arguments) pairs
+            return_exceptions: Return per-entry errors instead of raising
+        """
+        if not calls:
+            return []
+        if not self._batch_supported:
+            return await self._call_tools_concurrently(calls, return_exceptions)
+
+        await self._ensure_session()
+        http = await self._get_http()
+        ids = [self._next_id() for _ in calls]
+        body = orjson.dumps([
+            {
+                "jsonrpc": _JSONRPC_VERSION,
+                "id": request_id,
+                "method": "tools/call",
+                "params": {"name": name, "arguments": arguments},
+            }
+            for request_id, (name, arguments) in zip(ids, calls)
+        ])
+        async with self._limiter:
+            started = time.monotonic()
+            resp = await http.post("/mcp", content=body, headers=self._session_headers)
+        latency = time.monotonic() - started
+
+        if resp.status_code == 429 or resp.status_code >= 500:
+            self._limiter.on_overload()
+        _raise_for_auth(resp)
+
+        data = _json_or_none(resp)
+        if _batch_rejected(resp, data):
+            logger.info("Server rejected JSON-RPC batch, falling back to concurrent calls")
+            self._batch_supported = False
+            return await self._call_tools_concurrently(calls, return_exceptions)
+        if resp.status_code >= 400:
+            raise _error_from_http(resp)
+        if isinstance(data, dict) and isinstance(data.get("error"), dict):
+            raise _error_from_rpc(data["error"])
+        if not isinstance(data, list):
+            raise NerveError("Malformed JSON-RPC batch response")
+        self._limiter.on_success(latency)
+
+        by_id = {entry.get("id"): entry for entry in data if isinstance(entry, dict)}
+        results: List[Any] = []
+        for request_id in ids:
+            entry = by_id.get(request_id)
+            if entry is None:
+                outcome: Any = NerveError(f"No response for batch request id {request_id}")
+            elif entry.get("error"):
+                outcome = _error_from_rpc(entry["error"])
+            else:
+                results.append(entry.get("result"))
+                continue
+            if not return_exceptions:
+                raise outcome
+            results.append(outcome)
+        return results
+
+    async def gather_tools(
+        self,
+        calls: Sequence[Tuple[str, dict]],
+        *,
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """Execute independent tool calls, batching the idempotent ones.
+
+        Idempotent calls go out in one batch POST when there is more than
+        one of them; non-idempotent calls (send_reply, compose_email) are
+        always sent individually. Results are returned in call order.
+        """
+        batched = [i for i, (name, _) in enumerate(calls) if name not in _NON_IDEMPOTENT_TOOLS]
+        if len(batched) < 2:
+            return await self._call_tools_concurrently(calls, return_exceptions)
+
+        single = [i for i in range(len(calls)) if calls[i][0] in _NON_IDEMPOTENT_TOOLS]
+        batch_results, single_results = await asyncio.gather(
+            self.batch([calls[i] for i in batched], return_exceptions=return_exceptions),
+            self._call_tools_concurrently([calls[i] for i in single], return_exceptions),
+        )
+        results: List[Any] = [None] * len(calls)
+        for i, result in zip(batched, batch_results):
+            results[i] = result
+        for i, result in zip(single, single_results):
+            results[i] = result
+        return results
+
+    async def _call_tools_concurrently(
+        self,
+        calls: Sequence[Tuple[str, dict]],
+        return_exceptions: bool,
+    ) -> List[Any]:
+        return list(await asyncio.gather(
+            *(self._call_tool(name, arguments) for name, arguments in calls),
+            return_exceptions=return_exceptions,
+        ))
+
     async def close(self):
+        task = self._prefetch_task
+        if task is not None and not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
         if self._http and not self._http.is_closed:
             await self._http.aclose()
@@ -0,0 +1,107 @@
+"""
+Adaptive concurrency control for NerveClient.
+
+AIMDLimiter caps in-flight requests with an additive-increase /
+multiplicative-decrease limit, the same scheme TCP uses for its
+congestion window:
+
+- each fast success (windowed mean latency under target) grows the limit
+  by increase/limit, i.e. roughly +increase per round of full concurrency
+- each overload signal (rate limit, HTTP 429/5xx) multiplies it by decrease
+
+Under sustained pressure an agent loop backs off instead of piling retries
+onto an already saturated server.
+
+Usage:
+    limiter = AIMDLimiter(max_limit=32)
+    async with limiter:
+        started = time.monotonic()
+        resp = await http.post(...)
+    limiter.on_success(time.monotonic() - started)
+"""
+import asyncio
+from collections import deque
+from typing import Deque
+
+
+class AIMDLimiter:
+    """Async concurrency limiter with an AIMD-adjusted limit."""
+
+    def __init__(
+        self,
+        initial_limit: int = 8,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        target_latency: float = 1.0,
+        increase: float = 0.5,
+        decrease: float = 0.5,
+        window: int = 20,
+    ):
+        if not 1 <= min_limit <= max_limit:
+            raise ValueError("require 1 <= min_limit <= max_limit")
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._limit = float(min(max(initial_limit, min_limit), max_limit))
+        self._target_latency = target_latency
+        self._increase = increase
+        self._decrease = decrease
+        self._latencies: Deque[float] = deque(maxlen=window)
+        self._in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.release()
+
+    async def acquire(self):
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            return
+        fut = asyncio.get_running_loop().create_future()
+        self._waiters.append(fut)
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                # Slot was granted just before cancellation -- hand it on
+                self.release()
+            else:
+                try:
+                    self._waiters.remove(fut)
+                except ValueError:  # already popped and skipped by _wake()
+                    pass
+            raise
+
+    def release(self):
+        self._in_flight -= 1
+        self._wake()
+
+    def on_success(self, latency: float):
+        """Record a completed request; grow the limit while latency is on target."""
+        self._latencies.append(latency)
+        if sum(self._latencies) / len(self._latencies) < self._target_latency:
+            self._limit = min(self._limit + self._increase / self._limit, self._max_limit)
+            self._wake()
+
+    def on_overload(self):
+        """Server signalled overload (rate limit, 429, 5xx); shrink the limit."""
+        self._limit = max(self._limit * self._decrease, self._min_limit)
+
+    def _wake(self):
+        while self._waiters and self._in_flight < self.limit:
+            fut = self._waiters.popleft()
+            if not fut.done():
+                self._in_flight += 1
+                fut.set_result(None)
@@ -3,23 +3,46 @@
 
 class NerveError(Exception):
     """Base exception for all Nerve SDK errors."""
+    __slots__ = ("_message", "code")
+
     def __init__(self, message: str, code: int = 0):
-        super().__init__(message)
+        # Skips Exception.__init__; the message is kept in a slot and
+        # returned by __str__
+        self._message = message
         self.code = code
 
+    def __str__(self) -> str:
+        return self._message
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._message!r})"
+
+    def __reduce__(self):
+        # BaseException pickles only __dict__; carry slot attributes as well.
+        # Rebuild from the message: self.args holds only positional ctor
+        # args, which are empty for NerveError(message=...)
+        state = dict(getattr(self, "__dict__", {}))
+        for cls in type(self).__mro__:
+            for name in getattr(cls, "__slots__", ()):
+                if hasattr(self, name):
+                    state[name] = getattr(self, name)
+        return type(self), (self._message,), state
+
 
 class NerveSessionError(NerveError):
     """MCP session could not be established or expired."""
-    pass
+    __slots__ = ()
 
 
 class NerveAuthError(NerveError):
     """Authentication or authorization failure (401/403)."""
-    pass
+    __slots__ = ()
 
 
 class NerveRateLimitError(NerveError):
     """Rate limited (-32042). Retryable -- includes retry_after hint."""
+    __slots__ = ("retry_after",)
+
     def __init__(self, message: str, retry_after: float = 2.0):
         super().__init__(message, code=-32042)
         self.retry_after = retry_after
@@ -27,6 +50,8 @@ class NerveRateLimitError(NerveError):
 
 class NerveQuotaError(NerveError):
     """Usage quota exceeded (-32040). Non-retryable."""
+    __slots__ = ()
+
     def __init__(self, message: str = "Quota exceeded"):
         super().__init__(message, code=-32040)
 
@@ -36,5 +61,7 @@ class NerveSubscriptionError(NerveError):
 
     Tenant's Nerve subscription is paused/cancelled.
     """
+    __slots__ = ()
+
     def __init__(self, message: str = "Subscription inactive"):
         super().__init__(message, code=-32041)
@@ -13,9 +13,16 @@ Usage:
 
     # Raw JSON Schema (for custom frameworks)
     tools = get_tool_definitions(format="raw")
+
+    # Cached definitions shared between calls (treat as read-only)
+    tools = get_tool_definitions(format="claude", shared=True)
 """
+import copy
 from dataclasses import dataclass, field
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
+
+import orjson
 
 
 @dataclass
@@ -161,42 +168,44 @@ NERVE_TOOLS: Dict[str, ToolDefinition] = {
 
 # --- Format adapters ---
 
+def _schema(tool: ToolDefinition) -> Dict[str, Any]:
+    """JSON Schema for a tool, with required fields merged in.
+
+    Deep-copied, so adapter output never aliases NERVE_TOOLS.
+    """
+    schema = copy.deepcopy(tool.parameters)
+    if tool.required:
+        schema["required"] = list(tool.required)
+    return schema
+
+
 def _to_claude_format(tool: ToolDefinition, prefix: str = "") -> dict:
     """Convert to Claude/Anthropic tool_use format."""
-    schema = dict(tool.parameters)
-    if tool.required:
-        schema["required"] = tool.required
     return {
         "name": f"{prefix}{tool.name}",
         "description": tool.description,
-        "input_schema": schema,
+        "input_schema": _schema(tool),
     }
 
 
 def _to_openai_format(tool: ToolDefinition, prefix: str = "") -> dict:
     """Convert to OpenAI function calling format."""
-    schema = dict(tool.parameters)
-    if tool.required:
-        schema["required"] = tool.required
     return {
         "type": "function",
         "function": {
             "name": f"{prefix}{tool.name}",
             "description": tool.description,
-            "parameters": schema,
+            "parameters": _schema(tool),
         },
     }
 
 
 def _to_raw_format(tool: ToolDefinition, prefix: str = "") -> dict:
     """Return raw JSON Schema format."""
-    schema = dict(tool.parameters)
-    if tool.required:
-        schema["required"] = tool.required
     return {
         "name": f"{prefix}{tool.name}",
         "description": tool.description,
-        "parameters": schema,
+        "parameters": _schema(tool),
     }
 
 
@@ -208,17 +217,47 @@ _FORMAT_ADAPTERS = {
 }
 
 
+@lru_cache(maxsize=32)
+def _build_tool_definitions(format: str, prefix: str) -> Tuple[dict, ...]:
+    adapter = _FORMAT_ADAPTERS.get(format)
+    if not adapter:
+        raise ValueError(f"Unknown format '{format}'. Supported: {list(_FORMAT_ADAPTERS.keys())}")
+    return tuple(adapter(tool, prefix) for tool in NERVE_TOOLS.values())
+
+
+@lru_cache(maxsize=32)
+def _encoded_tool_definitions(format: str, prefix: str) -> bytes:
+    return orjson.dumps(_build_tool_definitions(format, prefix))
+
+
+# Encoded unprefixed definitions for every supported format, built once at
+# import so the default call is a dict lookup plus one orjson.loads()
+_PRECOMPUTED: Dict[str, bytes] = {
+    format: _encoded_tool_definitions(format, "") for format in _FORMAT_ADAPTERS
+}
+
+
 def get_tool_definitions(
     format: str = "claude",
     prefix: str = "",
+    shared: bool = False,
 ) -> List[dict]:
     """Get tool definitions in the specified framework format.
 
+    Definitions are built once per (format, prefix). Each call returns a
+    private copy (decoded from the cached JSON, much cheaper than a
+    deepcopy) that callers may modify freely, e.g. to add cache_control.
+
     Args:
         format: Target framework -- "claude", "openai", or "raw" (JSON Schema)
         prefix: Prefix added to tool names to avoid collisions (e.g., "email_")
+        shared: If True, return the cached dicts themselves -- no copy, but
+            they are shared by every shared=True caller and must not be
+            modified
     """
-    adapter = _FORMAT_ADAPTERS.get(format)
-    if not adapter:
-        raise ValueError(f"Unknown format '{format}'. Supported: {list(_FORMAT_ADAPTERS.keys())}")
-    return [adapter(tool, prefix) for tool in NERVE_TOOLS.values()]
+    if shared:
+        return list(_build_tool_definitions(format, prefix))
+    encoded = None if prefix else _PRECOMPUTED.get(format)
+    if encoded is None:
+        encoded = _encoded_tool_definitions(format, prefix)
+    return orjson.loads(encoded)
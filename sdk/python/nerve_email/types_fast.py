@@ -0,0 +1,177 @@
+"""Lightweight response types for Nerve email SDK.
+
+Frozen, slotted dataclass mirrors of the Pydantic models in types.py, for
+read-only consumption of server-trusted JSON. from_dict_fast() assigns
+fields directly -- no validation or coercion. Use the models in types.py
+when the data needs validating.
+
+With msgspec installed (pip install nerve-email[fast]), decode() parses
+raw JSON bytes straight into these types in C:
+
+    from typing import List
+    from nerve_email.types_fast import SearchResult, decode
+
+    results = decode(raw_bytes, List[SearchResult])
+"""
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Type, TypeVar
+
+import orjson
+
+try:
+    import msgspec
+except ImportError:  # optional "fast" extra
+    msgspec = None
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True, slots=True)
+class EmailAddress:
+    """Email address with optional display name."""
+    address: str
+    name: Optional[str] = None
+
+    @classmethod
+    def from_dict_fast(cls, d: Dict[str, Any]) -> "EmailAddress":
+        return cls(d["address"], d.get("name"))
+
+
+@dataclass(frozen=True, slots=True)
+class Message:
+    """A single email message within a thread."""
+    id: str
+    thread_id: str
+    from_: Optional[EmailAddress] = None
+    to: Optional[List[EmailAddress]] = None
+    subject: Optional[str] = None
+    body_text: Optional[str] = None
+    body_html: Optional[str] = None
+    received_at: Optional[str] = None
+
+    @classmethod
+    def from_dict_fast(cls, d: Dict[str, Any]) -> "Message":
+        sender = d.get("from_")
+        to = d.get("to")
+        return cls(
+            d["id"],
+            d["thread_id"],
+            EmailAddress.from_dict_fast(sender) if sender is not None else None,
+            [EmailAddress.from_dict_fast(a) for a in to] if to is not None else None,
+            d.get("subject"),
+            d.get("body_text"),
+            d.get("body_html"),
+            d.get("received_at"),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class Thread:
+    """An email thread (conversation)."""
+    id: str
+    subject: Optional[str] = None
+    status: Optional[str] = None
+    message_count: Optional[int] = None
+    last_message_at: Optional[str] = None
+    messages: Optional[List[Message]] = None
+
+    @classmethod
+    def from_dict_fast(cls, d: Dict[str, Any]) -> "Thread":
+        messages = d.get("messages")
+        return cls(
+            d["id"],
+            d.get("subject"),
+            d.get("status"),
+            d.get("message_count"),
+            d.get("last_message_at"),
+            [Message.from_dict_fast(m) for m in messages] if messages is not None else None,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class SearchResult:
+    """A single search result."""
+    message_id: str
+    thread_id: str
+    subject: Optional[str] = None
+    snippet: Optional[str] = None
+    score: Optional[float] = None
+
+    @classmethod
+    def from_dict_fast(cls, d: Dict[str, Any]) -> "SearchResult":
+        return cls(
+            d["message_id"],
+            d["thread_id"],
+            d.get("subject"),
+            d.get("snippet"),
+            d.get("score"),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class TriageResult:
+    """Result of message triage/classification."""
+    message_id: str
+    intent: Optional[str] = None
+    urgency: Optional[str] = None
+    sentiment: Optional[str] = None
+    suggested_action: Optional[str] = None
+
+    @classmethod
+    def from_dict_fast(cls, d: Dict[str, Any]) -> "TriageResult":
+        return cls(
+            d["message_id"],
+            d.get("intent"),
+            d.get("urgency"),
+            d.get("sentiment"),
+            d.get("suggested_action"),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class DraftResult:
+    """Result of drafting a reply."""
+    draft: str
+    draft_id: Optional[str] = None
+    risk_flags: Optional[List[str]] = None
+    auto_approved: Optional[bool] = None
+
+    @classmethod
+    def from_dict_fast(cls, d: Dict[str, Any]) -> "DraftResult":
+        return cls(d["draft"], d.get("draft_id"), d.get("risk_flags"), d.get("auto_approved"))
+
+
+@dataclass(frozen=True, slots=True)
+class SendResult:
+    """Result of sending an email."""
+    message_id: str
+    status: Optional[str] = None
+
+    @classmethod
+    def from_dict_fast(cls, d: Dict[str, Any]) -> "SendResult":
+        return cls(d["message_id"], d.get("status"))
+
+
+@dataclass(frozen=True, slots=True)
+class InboxList:
+    """List of available inboxes."""
+    inbox_ids: List[str] = field(default_factory=list)
+
+    @classmethod
+    def from_dict_fast(cls, d: Dict[str, Any]) -> "InboxList":
+        return cls(d.get("inbox_ids", []))
+
+
+def decode(raw: bytes, type: Type[T]) -> T:
+    """Decode raw JSON bytes into a type from this module (or List of one).
+
+    Uses msgspec when installed; otherwise parses with orjson and builds
+    the result with from_dict_fast().
+    """
+    if msgspec is not None:
+        return msgspec.json.decode(raw, type=type)
+    data = orjson.loads(raw)
+    item_types = getattr(type, "__args__", None)
+    if item_types:
+        return [item_types[0].from_dict_fast(d) for d in data]
+    return type.from_dict_fast(data)
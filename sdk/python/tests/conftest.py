@@ -1,16 +1,85 @@
 """Shared fixtures for nerve-email SDK tests."""
+import asyncio
+import sys
+from collections import defaultdict, deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+import orjson
 import pytest
+import pytest_asyncio
 import httpx
 import respx
 
+try:
+    import msgspec
+except ImportError:  # optional "fast" extra
+    msgspec = None
+
 from nerve_email import NerveClient, NerveAdmin
+from nerve_email.tools import get_tool_definitions
+
+JSON_HEADERS = {"content-type": "application/json"}
+
+_TOOL_FORMATS = ("claude", "openai", "raw")
+_TOOL_PREFIXES = ("", "email_")
+_TOOL_DEFS_KEY = pytest.StashKey[Dict[Tuple[str, str], List[Dict[str, Any]]]]()
+
+
+def pytest_configure(config):
+    # Build every (format, prefix) variant once per process; see tool_defs
+    config.stash[_TOOL_DEFS_KEY] = {
+        (fmt, prefix): get_tool_definitions(format=fmt, prefix=prefix, shared=True)
+        for fmt in _TOOL_FORMATS
+        for prefix in _TOOL_PREFIXES
+    }
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_asyncio_loop_factories(config, item):
+    """Run async tests on uvloop when it is installed, else the stock loop.
+
+    The hook must always return a factory mapping; None is a usage error.
+    """
+    if sys.platform != "win32":
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            return {"uvloop": uvloop.new_event_loop}
+    return {"asyncio": asyncio.new_event_loop}
+
+
+@pytest.fixture(scope="session")
+def tool_defs(pytestconfig):
+    """Read-only tool definitions keyed by (format, prefix)."""
+    return pytestconfig.stash[_TOOL_DEFS_KEY]
+
+
+@pytest.fixture(scope="session")
+def _respx_router():
+    """Single respx router for the whole test session.
+
+    Built once and never patched into httpx globally: clients reach it
+    through mock_transport. mock_api rolls back routes and call history
+    after each test. Unused routes are not asserted on -- tests that care
+    call router.assert_all_called(). Unmatched requests still raise.
+    """
+    return respx.Router(base_url="http://nerve-test:8088", assert_all_called=False)
+
+
+@pytest.fixture(scope="session")
+def mock_transport(_respx_router):
+    """httpx transport that answers from the session respx router."""
+    return httpx.MockTransport(_respx_router.async_handler)
 
 
 @pytest.fixture
-def mock_api():
+def mock_api(_respx_router):
     """respx mock router for Nerve HTTP API."""
-    with respx.mock(base_url="http://nerve-test:8088") as router:
-        yield router
+    _respx_router.snapshot()
+    yield _respx_router
+    _respx_router.rollback()
 
 
 @pytest.fixture
@@ -22,59 +91,181 @@ def mock_initialize(mock_api):
     return mock_api
 
 
-def _initialize_side_effect(request: httpx.Request) -> httpx.Response:
-    """Handle MCP requests, returning session ID on initialize."""
-    import json
-    body = json.loads(request.content)
-    method = body.get("method")
-
-    if method == "initialize":
-        return httpx.Response(
-            200,
-            json={"jsonrpc": "2.0", "id": body["id"], "result": {"protocolVersion": "2025-11-25"}},
-            headers={"MCP-Session-Id": "test-session-123"},
-        )
-    elif method == "tools/list":
-        return httpx.Response(
-            200,
-            json={
-                "jsonrpc": "2.0",
-                "id": body["id"],
-                "result": {
-                    "tools": [
-                        {"name": "list_threads", "inputSchema": {"type": "object", "properties": {"inbox_id": {"type": "string"}, "status": {"type": "string"}, "limit": {"type": "integer"}, "cursor": {"type": "string"}}}},
-                        {"name": "get_thread", "inputSchema": {"type": "object", "properties": {"thread_id": {"type": "string"}}}},
-                        {"name": "search_inbox", "inputSchema": {"type": "object", "properties": {"inbox_id": {"type": "string"}, "query": {"type": "string"}, "top_k": {"type": "integer"}, "cursor": {"type": "string"}}}},
-                        {"name": "triage_message", "inputSchema": {"type": "object", "properties": {"message_id": {"type": "string"}}}},
-                        {"name": "extract_to_schema", "inputSchema": {"type": "object", "properties": {"message_id": {"type": "string"}, "schema_id": {"type": "string"}}}},
-                        {"name": "draft_reply_with_policy", "inputSchema": {"type": "object", "properties": {"thread_id": {"type": "string"}, "goal": {"type": "string"}}}},
-                        {"name": "send_reply", "inputSchema": {"type": "object", "properties": {"thread_id": {"type": "string"}, "body_or_draft_id": {"type": "string"}, "needs_human_approval": {"type": "boolean"}}}},
-                    ]
-                },
-            },
-        )
-    elif method == "tools/call":
-        tool_name = body["params"]["name"]
-        args = body["params"]["arguments"]
-        return httpx.Response(
-            200,
-            json={
-                "jsonrpc": "2.0",
-                "id": body["id"],
-                "result": {"tool": tool_name, "args": args, "mock": True},
-            },
-        )
-    elif method == "resources/read":
-        return httpx.Response(
-            200,
-            json={
-                "jsonrpc": "2.0",
-                "id": body["id"],
-                "result": {"inbox_ids": ["inbox_test_1"]},
-            },
-        )
+@pytest.fixture
+def mcp_server(mock_api):
+    """Scriptable MockMCPServer mounted on /mcp."""
+    server = MockMCPServer()
+    mock_api.post("/mcp").mock(side_effect=server)
+    return server
+
+
+@pytest_asyncio.fixture
+async def fake_session_client(mock_transport):
+    """NerveClient with a pre-set MCP session; no initialize round trip.
+
+    For tests that only check request/response routing. Pair with
+    mock_initialize for the tool and resource handlers.
+    """
+    client = NerveClient._for_tests(
+        base_url="http://nerve-test:8088", api_key="test-key", transport=mock_transport,
+    )
+    yield client
+    await client.close()
+
+
+@pytest_asyncio.fixture(scope="module")
+async def shared_client(mock_transport):
+    """One pre-initialized NerveClient per test module.
+
+    Like fake_session_client, but its connection pool is reused across
+    the module. Tests that mutate session state (expiry, retries) should
+    build their own client. Pair with mock_initialize.
+    """
+    client = NerveClient._for_tests(
+        base_url="http://nerve-test:8088", api_key="test-key", transport=mock_transport,
+    )
+    yield client
+    await client.close()
+
+
+_TOOLS_LIST_RESULT = {
+    "tools": [
+        {"name": "list_threads", "inputSchema": {"type": "object", "properties": {"inbox_id": {"type": "string"}, "status": {"type": "string"}, "limit": {"type": "integer"}, "cursor": {"type": "string"}}}},
+        {"name": "get_thread", "inputSchema": {"type": "object", "properties": {"thread_id": {"type": "string"}}}},
+        {"name": "search_inbox", "inputSchema": {"type": "object", "properties": {"inbox_id": {"type": "string"}, "query": {"type": "string"}, "top_k": {"type": "integer"}, "cursor": {"type": "string"}}}},
+        {"name": "triage_message", "inputSchema": {"type": "object", "properties": {"message_id": {"type": "string"}}}},
+        {"name": "extract_to_schema", "inputSchema": {"type": "object", "properties": {"message_id": {"type": "string"}, "schema_id": {"type": "string"}}}},
+        {"name": "draft_reply_with_policy", "inputSchema": {"type": "object", "properties": {"thread_id": {"type": "string"}, "goal": {"type": "string"}}}},
+        {"name": "send_reply", "inputSchema": {"type": "object", "properties": {"thread_id": {"type": "string"}, "body_or_draft_id": {"type": "string"}, "needs_human_approval": {"type": "boolean"}}}},
+        {"name": "compose_email", "inputSchema": {"type": "object", "properties": {"inbox_id": {"type": "string"}, "to": {"type": "string"}, "subject": {"type": "string"}, "body": {"type": "string"}}}},
+    ]
+}
+_RESOURCES_READ_RESULT = {"inbox_ids": ["inbox_test_1"]}
+
+# Static results are encoded once; only the request id is spliced in per call.
+_RPC_PREFIX = b'{"jsonrpc":"2.0","id":'
+_TOOLS_LIST_SUFFIX = b',"result":' + orjson.dumps(_TOOLS_LIST_RESULT) + b'}'
+_RESOURCES_READ_SUFFIX = b',"result":' + orjson.dumps(_RESOURCES_READ_RESULT) + b'}'
+
+
+def _rpc_response(body: dict, result: dict, headers: dict = JSON_HEADERS) -> httpx.Response:
+    return httpx.Response(
+        200,
+        content=orjson.dumps({"jsonrpc": "2.0", "id": body["id"], "result": result}),
+        headers=headers,
+    )
+
+
+def _h_initialize(body: dict) -> httpx.Response:
+    return _rpc_response(
+        body,
+        {"protocolVersion": "2025-11-25"},
+        headers={**JSON_HEADERS, "MCP-Session-Id": "test-session-123"},
+    )
+
 
+def _static_response(body: dict, suffix: bytes) -> httpx.Response:
     return httpx.Response(
         200,
-        json={"jsonrpc": "2.0", "id": body["id"], "result": {}},
+        content=_RPC_PREFIX + orjson.dumps(body["id"]) + suffix,
+        headers=JSON_HEADERS,
     )
+
+
+def _h_tools_list(body: dict) -> httpx.Response:
+    return _static_response(body, _TOOLS_LIST_SUFFIX)
+
+
+if msgspec is not None:
+    class _ToolCallEcho(msgspec.Struct):
+        tool: str
+        args: Dict[str, Any]
+        mock: bool = True
+
+    class _ToolCallResponse(msgspec.Struct, kw_only=True):
+        jsonrpc: str = "2.0"
+        id: Any
+        result: _ToolCallEcho
+
+    _tool_call_encoder = msgspec.json.Encoder()
+
+
+def _h_tools_call(body: dict) -> httpx.Response:
+    params = body["params"]
+    if msgspec is None:
+        return _rpc_response(body, {"tool": params["name"], "args": params["arguments"], "mock": True})
+    # Encoded straight from structs, no intermediate response dict
+    echo = _ToolCallEcho(params["name"], params["arguments"])
+    return httpx.Response(
+        200,
+        content=_tool_call_encoder.encode(_ToolCallResponse(id=body["id"], result=echo)),
+        headers=JSON_HEADERS,
+    )
+
+
+def _h_resources_read(body: dict) -> httpx.Response:
+    return _static_response(body, _RESOURCES_READ_SUFFIX)
+
+
+def _h_default(body: dict) -> httpx.Response:
+    return _rpc_response(body, {})
+
+
+_HANDLERS = {
+    "initialize": _h_initialize,
+    "tools/list": _h_tools_list,
+    "tools/call": _h_tools_call,
+    "resources/read": _h_resources_read,
+}
+
+
+def _initialize_side_effect(request: httpx.Request) -> httpx.Response:
+    """Handle MCP requests, returning session ID on initialize."""
+    body = orjson.loads(request.content)
+    return _HANDLERS.get(body.get("method"), _h_default)(body)
+
+
+class MockMCPServer:
+    """Stateful /mcp side effect for tests that script server behaviour.
+
+    Counts initialize and tools/call requests, and returns queued
+    JSON-RPC errors before falling back to the canned handlers:
+
+        mcp_server.fail_next("tools/call", -32042, "Rate limited", times=2)
+        mcp_server.tool_result = {"threads": []}
+    """
+
+    def __init__(self, session_id: str = "test-session-123"):
+        self.session_id = session_id
+        self.tool_result: Optional[Dict[str, Any]] = None
+        self.initialize_count = 0
+        self.tools_call_count = 0
+        self._errors: Dict[str, Deque[Dict[str, Any]]] = defaultdict(deque)
+
+    def fail_next(self, method: str, code: int, message: str, data: Optional[dict] = None, times: int = 1):
+        """Answer the next `times` calls to `method` with a JSON-RPC error."""
+        error = {"code": code, "message": message}
+        if data is not None:
+            error["data"] = data
+        self._errors[method].extend([error] * times)
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        body = orjson.loads(request.content)
+        method = body.get("method")
+        if method == "initialize":
+            self.initialize_count += 1
+        elif method == "tools/call":
+            self.tools_call_count += 1
+
+        errors = self._errors.get(method)
+        if errors:
+            return httpx.Response(
+                200,
+                content=orjson.dumps({"jsonrpc": "2.0", "id": body["id"], "error": errors.popleft()}),
+                headers=JSON_HEADERS,
+            )
+        if method == "initialize":
+            return _rpc_response(body, {}, headers={**JSON_HEADERS, "MCP-Session-Id": self.session_id})
+        if method == "tools/call" and self.tool_result is not None:
+            return _rpc_response(body, self.tool_result)
+        return _HANDLERS.get(method, _h_default)(body)
@@ -1,12 +1,11 @@
 """Unit tests for NerveClient -- MCP session, retry, error handling."""
 import asyncio
-import json
 
 import httpx
+import orjson
 import pytest
-import respx
 
-from nerve_email import NerveClient
+from nerve_email import NerveAdmin, NerveClient
 from nerve_email.exceptions import (
     NerveAuthError,
     NerveError,
@@ -16,328 +15,515 @@ from nerve_email.exceptions import (
     NerveSubscriptionError,
 )
 
+_EMPTY_BODY = orjson.dumps({})
+_JSON_HEADERS = {"content-type": "application/json"}
+
 
 # --- Session management ---
 
 
-@pytest.mark.asyncio
-async def test_session_initialization(mock_initialize):
+async def test_session_initialization(mock_initialize, mock_transport):
     """Client initializes MCP session on first call."""
-    async with NerveClient(base_url="http://nerve-test:8088", api_key="test-key") as client:
+    async with NerveClient(base_url="http://nerve-test:8088", api_key="test-key", transport=mock_transport) as client:
         assert await client.health_check()
         assert client._session_id == "test-session-123"
 
 
-@pytest.mark.asyncio
-async def test_concurrent_session_init_single_initialize():
+async def test_concurrent_session_init_single_initialize(mcp_server, mock_transport):
     """10 parallel calls should only trigger 1 initialize request."""
-    initialize_count = 0
+    async with NerveClient(base_url="http://nerve-test:8088", api_key="test-key", transport=mock_transport) as client:
+        # Fire 10 concurrent list_threads calls
+        tasks = [
+            client.list_threads(inbox_id="inbox_1")
+            for _ in range(10)
+        ]
+        await asyncio.gather(*tasks)
 
-    def handle_request(request: httpx.Request) -> httpx.Response:
-        nonlocal initialize_count
-        body = json.loads(request.content)
-        method = body.get("method")
+        # Only 1 initialize should have been called
+        assert mcp_server.initialize_count == 1
 
-        if method == "initialize":
-            initialize_count += 1
-            return httpx.Response(
-                200,
-                json={"jsonrpc": "2.0", "id": body["id"], "result": {"protocolVersion": "2025-11-25"}},
-                headers={"MCP-Session-Id": "session-concurrent"},
-            )
-        elif method == "tools/call":
-            return httpx.Response(
-                200,
-                json={"jsonrpc": "2.0", "id": body["id"], "result": {"threads": []}},
-            )
-        return httpx.Response(200, json={"jsonrpc": "2.0", "id": body["id"], "result": {}})
 
-    with respx.mock(base_url="http://nerve-test:8088") as mock:
-        mock.post("/mcp").mock(side_effect=handle_request)
+async def test_session_expiry_recovery(mcp_server, mock_transport):
+    """Client re-initializes when session expires."""
+    mcp_server.tool_result = {"threads": []}
+    mcp_server.fail_next("tools/call", -32000, "Session expired")
 
-        async with NerveClient(base_url="http://nerve-test:8088", api_key="test-key") as client:
-            # Fire 10 concurrent list_threads calls
-            tasks = [
-                client.list_threads(inbox_id="inbox_1")
-                for _ in range(10)
-            ]
-            await asyncio.gather(*tasks)
+    async with NerveClient(base_url="http://nerve-test:8088", api_key="test-key", transport=mock_transport) as client:
+        result = await client.list_threads(inbox_id="inbox_1")
+        assert result == {"threads": []}
+        # Session should have been re-initialized
+        assert mcp_server.initialize_count == 2
+        assert client._session_id == mcp_server.session_id
 
-            # Only 1 initialize should have been called
-            assert initialize_count == 1
 
+async def test_prefetch_session_single_initialize(mcp_server, mock_transport):
+    """prefetch_session starts initialize on entry; the first call reuses it."""
+    mcp_server.tool_result = {"threads": []}
 
-@pytest.mark.asyncio
-async def test_session_expiry_recovery():
-    """Client re-initializes when session expires."""
-    call_count = 0
+    async with NerveClient(
+        base_url="http://nerve-test:8088", api_key="test-key", prefetch_session=True,
+        transport=mock_transport,
+    ) as client:
+        assert await client.list_threads(inbox_id="inbox_1") == {"threads": []}
+        assert client._session_id == mcp_server.session_id
+        assert mcp_server.initialize_count == 1
 
-    def handle_request(request: httpx.Request) -> httpx.Response:
-        nonlocal call_count
-        call_count += 1
-        body = json.loads(request.content)
-        method = body.get("method")
 
-        if method == "initialize":
-            return httpx.Response(
-                200,
-                json={"jsonrpc": "2.0", "id": body["id"], "result": {}},
-                headers={"MCP-Session-Id": f"session-{call_count}"},
-            )
-        elif method == "tools/call":
-            # First tool call returns session error
-            if call_count == 2:
-                return httpx.Response(
-                    200,
-                    json={
-                        "jsonrpc": "2.0",
-                        "id": body["id"],
-                        "error": {"code": -32000, "message": "Session expired"},
-                    },
-                )
-            return httpx.Response(
-                200,
-                json={"jsonrpc": "2.0", "id": body["id"], "result": {"threads": []}},
+# --- Retry logic ---
+
+
+async def test_rate_limit_retry_idempotent(mcp_server, mock_transport):
+    """Idempotent tools retry on rate limit, then succeed."""
+    mcp_server.tool_result = {"threads": []}
+    mcp_server.fail_next("tools/call", -32042, "Rate limited", data={"retry_after_seconds": 0})
+
+    async with NerveClient(base_url="http://nerve-test:8088", api_key="test-key", max_retries=3, transport=mock_transport) as client:
+        result = await client.list_threads(inbox_id="inbox_1")
+        assert result == {"threads": []}
+        assert mcp_server.tools_call_count == 2
+
+
+async def test_rate_limit_no_retry_send_reply(mcp_server, mock_transport):
+    """send_reply (non-idempotent) raises immediately on rate limit."""
+    mcp_server.fail_next("tools/call", -32042, "Rate limited", data={"retry_after_seconds": 5})
+
+    async with NerveClient(base_url="http://nerve-test:8088", api_key="test-key", transport=mock_transport) as client:
+        with pytest.raises(NerveRateLimitError) as exc_info:
+            await client.send_reply(
+                thread_id="t1",
+                body_or_draft_id="draft_1",
             )
-        return httpx.Response(200, json={"jsonrpc": "2.0", "id": body["id"], "result": {}})
+        assert exc_info.value.retry_after == 5
+        # The traceback references this frame; drop it to break the cycle
+        del exc_info
+        assert mcp_server.tools_call_count == 1
 
-    with respx.mock(base_url="http://nerve-test:8088") as mock:
-        mock.post("/mcp").mock(side_effect=handle_request)
 
-        async with NerveClient(base_url="http://nerve-test:8088", api_key="test-key") as client:
-            result = await client.list_threads(inbox_id="inbox_1")
-            assert result == {"threads": []}
-            # Session should have been re-initialized
-            assert client._session_id.startswith("session-")
+# --- Error handling ---
 
 
-# --- Retry logic ---
+async def test_auth_error_401(mock_api, mock_transport):
+    """401 response raises NerveAuthError."""
+    mock_api.post("/mcp").mock(return_value=httpx.Response(401, content=_EMPTY_BODY))
 
+    async with NerveClient(base_url="http://nerve-test:8088", api_key="bad-key", transport=mock_transport) as client:
+        # health_check() catches exceptions, so use list_threads instead
+        with pytest.raises(NerveAuthError):
+            await client.list_threads(inbox_id="inbox_1")
 
-@pytest.mark.asyncio
-async def test_rate_limit_retry_idempotent():
-    """Idempotent tools retry on rate limit, then succeed."""
-    attempt = 0
 
-    def handle_request(request: httpx.Request) -> httpx.Response:
-        nonlocal attempt
-        attempt += 1
-        body = json.loads(request.content)
-        method = body.get("method")
+async def test_quota_exceeded(mcp_server, mock_transport):
+    """-32040 maps to NerveQuotaError."""
+    mcp_server.fail_next("tools/call", -32040, "Quota exceeded")
 
-        if method == "initialize":
-            return httpx.Response(
-                200,
-                json={"jsonrpc": "2.0", "id": body["id"], "result": {}},
-                headers={"MCP-Session-Id": "session-retry"},
-            )
-        elif method == "tools/call":
-            if attempt <= 2:  # First tool call: rate limited
-                return httpx.Response(
-                    200,
-                    json={
-                        "jsonrpc": "2.0",
-                        "id": body["id"],
-                        "error": {
-                            "code": -32042,
-                            "message": "Rate limited",
-                            "data": {"retry_after_seconds": 0},
-                        },
-                    },
-                )
-            return httpx.Response(
-                200,
-                json={"jsonrpc": "2.0", "id": body["id"], "result": {"threads": []}},
-            )
-        return httpx.Response(200, json={"jsonrpc": "2.0", "id": body["id"], "result": {}})
+    async with NerveClient(base_url="http://nerve-test:8088", api_key="test-key", transport=mock_transport) as client:
+        with pytest.raises(NerveQuotaError):
+            await client.list_threads(inbox_id="inbox_1")
 
-    with respx.mock(base_url="http://nerve-test:8088") as mock:
-        mock.post("/mcp").mock(side_effect=handle_request)
 
-        async with NerveClient(base_url="http://nerve-test:8088", api_key="test-key", max_retries=3) as client:
-            result = await client.list_threads(inbox_id="inbox_1")
-            assert result == {"threads": []}
+async def test_subscription_inactive(mcp_server, mock_transport):
+    """-32041 maps to NerveSubscriptionError."""
+    mcp_server.fail_next("tools/call", -32041, "Subscription inactive")
 
+    async with NerveClient(base_url="http://nerve-test:8088", api_key="test-key", transport=mock_transport) as client:
+        with pytest.raises(NerveSubscriptionError):
+            await client.list_threads(inbox_id="inbox_1")
 
-@pytest.mark.asyncio
-async def test_rate_limit_no_retry_send_reply():
-    """send_reply (non-idempotent) raises immediately on rate limit."""
-    def handle_request(request: httpx.Request) -> httpx.Response:
-        body = json.loads(request.content)
-        method = body.get("method")
 
-        if method == "initialize":
-            return httpx.Response(
-                200,
-                json={"jsonrpc": "2.0", "id": body["id"], "result": {}},
-                headers={"MCP-Session-Id": "session-noop"},
-            )
-        elif method == "tools/call":
-            return httpx.Response(
-                200,
-                json={
-                    "jsonrpc": "2.0",
-                    "id": body["id"],
-                    "error": {
-                        "code": -32042,
-                        "message": "Rate limited",
-                        "data": {"retry_after_seconds": 5},
-                    },
-                },
-            )
-        return httpx.Response(200, json={"jsonrpc": "2.0", "id": body["id"], "result": {}})
+# --- Tool methods ---
 
-    with respx.mock(base_url="http://nerve-test:8088") as mock:
-        mock.post("/mcp").mock(side_effect=handle_request)
 
-        async with NerveClient(base_url="http://nerve-test:8088", api_key="test-key") as client:
-            with pytest.raises(NerveRateLimitError) as exc_info:
-                await client.send_reply(
-                    thread_id="t1",
-                    body_or_draft_id="draft_1",
-                )
-            assert exc_info.value.retry_after == 5
+async def test_list_threads_sends_correct_rpc(fake_session_client, mock_initialize):
+    """list_threads sends correct JSON-RPC with session and MCP-Protocol-Version header."""
+    result = await fake_session_client.list_threads(inbox_id="inbox_1", status="open", limit=20)
+    assert result["tool"] == "list_threads"
+    assert result["args"]["inbox_id"] == "inbox_1"
+    assert result["args"]["status"] == "open"
+    assert result["args"]["limit"] == 20
+    # Pre-set session: the tool call is the only request
+    assert mock_initialize.calls.call_count == 1
+    assert mock_initialize.calls.last.request.headers["MCP-Session-Id"] == "test-session-123"
 
 
-# --- Error handling ---
+async def test_search_inbox(fake_session_client, mock_initialize):
+    """search_inbox passes query and cursor correctly."""
+    result = await fake_session_client.search_inbox(inbox_id="inbox_1", query="refund", cursor="page2")
+    assert result["args"]["query"] == "refund"
+    assert result["args"]["cursor"] == "page2"
 
 
-@pytest.mark.asyncio
-async def test_auth_error_401():
-    """401 response raises NerveAuthError."""
-    with respx.mock(base_url="http://nerve-test:8088") as mock:
-        mock.post("/mcp").mock(return_value=httpx.Response(401, json={}))
+async def test_list_inboxes(fake_session_client, mock_initialize):
+    """list_inboxes reads the email://inboxes resource."""
+    result = await fake_session_client.list_inboxes()
+    assert "inbox_ids" in result
 
-        async with NerveClient(base_url="http://nerve-test:8088", api_key="bad-key") as client:
-            # health_check() catches exceptions, so use list_threads instead
-            with pytest.raises(NerveAuthError):
-                await client.list_threads(inbox_id="inbox_1")
 
+async def test_health_check_true(mock_initialize, mock_transport):
+    """health_check returns True when server is reachable."""
+    async with NerveClient(base_url="http://nerve-test:8088", api_key="test-key", transport=mock_transport) as client:
+        assert await client.health_check() is True
 
-@pytest.mark.asyncio
-async def test_quota_exceeded():
-    """-32040 maps to NerveQuotaError."""
-    def handle_request(request: httpx.Request) -> httpx.Response:
-        body = json.loads(request.content)
-        method = body.get("method")
 
-        if method == "initialize":
+async def test_health_check_false(mock_api, mock_transport):
+    """health_check returns False on connection error."""
+    mock_api.post("/mcp").mock(side_effect=httpx.ConnectError("Connection refused"))
+
+    async with NerveClient(base_url="http://nerve-test:8088", api_key="test-key", transport=mock_transport) as client:
+        assert await client.health_check() is False
+
+
+@pytest.mark.parametrize(
+    "cls,api_key",
+    [(NerveClient, "test-key"), (NerveAdmin, "admin-key")],
+    ids=["client", "admin"],
+)
+async def test_context_manager_cleanup(cls, api_key, mock_transport):
+    """async with closes the HTTP client on exit."""
+    async with cls(base_url="http://nerve-test:8088", api_key=api_key, transport=mock_transport) as sdk:
+        http = await sdk._get_http()
+    # After exiting context, HTTP client should be closed
+    assert http.is_closed
+
+
+async def test_list_tools(fake_session_client, mock_initialize):
+    """list_tools returns server tool definitions."""
+    tools = await fake_session_client.list_tools()
+    assert len(tools) == 8
+    names = {t["name"] for t in tools}
+    assert "list_threads" in names
+    assert "send_reply" in names
+
+
+# --- Batch execution ---
+
+
+async def test_batch_single_post(mock_api, mock_transport):
+    """batch sends one JSON-RPC array and returns results in call order."""
+    batch_posts = [0]
+
+    def handle_request(request: httpx.Request) -> httpx.Response:
+        body = orjson.loads(request.content)
+        if isinstance(body, list):
+            batch_posts[0] += 1
+            # Respond out of order; client must match by id
             return httpx.Response(
                 200,
-                json={"jsonrpc": "2.0", "id": body["id"], "result": {}},
-                headers={"MCP-Session-Id": "session-quota"},
+                content=orjson.dumps([
+                    {"jsonrpc": "2.0", "id": req["id"], "result": {"tool": req["params"]["name"]}}
+                    for req in reversed(body)
+                ]),
+                headers=_JSON_HEADERS,
             )
         return httpx.Response(
             200,
-            json={
-                "jsonrpc": "2.0",
-                "id": body["id"],
-                "error": {"code": -32040, "message": "Quota exceeded"},
-            },
+            content=orjson.dumps({"jsonrpc": "2.0", "id": body["id"], "result": {}}),
+            headers={**_JSON_HEADERS, "MCP-Session-Id": "session-batch"},
         )
 
-    with respx.mock(base_url="http://nerve-test:8088") as mock:
-        mock.post("/mcp").mock(side_effect=handle_request)
+    mock_api.post("/mcp").mock(side_effect=handle_request)
 
-        async with NerveClient(base_url="http://nerve-test:8088", api_key="test-key") as client:
-            with pytest.raises(NerveQuotaError):
-                await client.list_threads(inbox_id="inbox_1")
+    async with NerveClient(base_url="http://nerve-test:8088", api_key="test-key", transport=mock_transport) as client:
+        results = await client.batch([
+            ("get_thread", {"thread_id": "t1"}),
+            ("triage_message", {"message_id": "m1"}),
+        ])
+        assert [r["tool"] for r in results] == ["get_thread", "triage_message"]
+        assert batch_posts[0] == 1
 
 
-@pytest.mark.asyncio
-async def test_subscription_inactive():
-    """-32041 maps to NerveSubscriptionError."""
+async def test_batch_falls_back_when_unsupported(mock_api, mock_transport):
+    """Servers that reject batch POSTs get concurrent single calls instead."""
     def handle_request(request: httpx.Request) -> httpx.Response:
-        body = json.loads(request.content)
-        method = body.get("method")
+        body = orjson.loads(request.content)
+        if isinstance(body, list):
+            return httpx.Response(400, text="invalid json")
+        if body["method"] == "initialize":
+            return httpx.Response(
+                200,
+                content=orjson.dumps({"jsonrpc": "2.0", "id": body["id"], "result": {}}),
+                headers={**_JSON_HEADERS, "MCP-Session-Id": "session-nobatch"},
+            )
+        return httpx.Response(
+            200,
+            content=orjson.dumps({"jsonrpc": "2.0", "id": body["id"], "result": body["params"]["arguments"]}),
+            headers=_JSON_HEADERS,
+        )
+
+    mock_api.post("/mcp").mock(side_effect=handle_request)
+
+    async with NerveClient(base_url="http://nerve-test:8088", api_key="test-key", transport=mock_transport) as client:
+        results = await client.batch([
+            ("get_thread", {"thread_id": "t1"}),
+            ("get_thread", {"thread_id": "t2"}),
+        ])
+        assert [r["thread_id"] for r in results] == ["t1", "t2"]
+        assert client._batch_supported is False
+
+
+def _batch_server(batch_response=None):
+    """/mcp handler answering batch POSTs with `batch_response`.
+
+    Without a batch_response each batch entry echoes its arguments.
+    Returns the handler and a list of the tool names sent as single calls.
+    """
+    single_calls = []
 
-        if method == "initialize":
+    def handle_request(request: httpx.Request) -> httpx.Response:
+        body = orjson.loads(request.content)
+        if isinstance(body, list):
+            if batch_response is not None:
+                return batch_response
             return httpx.Response(
                 200,
-                json={"jsonrpc": "2.0", "id": body["id"], "result": {}},
-                headers={"MCP-Session-Id": "session-sub"},
+                content=orjson.dumps([
+                    {"jsonrpc": "2.0", "id": req["id"], "result": req["params"]["arguments"]}
+                    for req in body
+                ]),
+                headers=_JSON_HEADERS,
             )
+        headers = _JSON_HEADERS
+        if body["method"] == "initialize":
+            headers = {**_JSON_HEADERS, "MCP-Session-Id": "session-batch"}
+            result = {}
+        else:
+            single_calls.append(body["params"]["name"])
+            result = body["params"]["arguments"]
         return httpx.Response(
             200,
-            json={
-                "jsonrpc": "2.0",
-                "id": body["id"],
-                "error": {"code": -32041, "message": "Subscription inactive"},
-            },
+            content=orjson.dumps({"jsonrpc": "2.0", "id": body["id"], "result": result}),
+            headers=headers,
         )
 
-    with respx.mock(base_url="http://nerve-test:8088") as mock:
-        mock.post("/mcp").mock(side_effect=handle_request)
+    return handle_request, single_calls
 
-        async with NerveClient(base_url="http://nerve-test:8088", api_key="test-key") as client:
-            with pytest.raises(NerveSubscriptionError):
-                await client.list_threads(inbox_id="inbox_1")
 
+_REPLY_CALLS = [
+    ("get_thread", {"thread_id": "t1"}),
+    ("send_reply", {"thread_id": "t1", "body_text": "hi"}),
+]
+
+
+async def test_batch_overload_raises_without_fallback(mock_api, mock_transport):
+    """A 5xx batch response shrinks the limiter and re-sends nothing."""
+    handler, single_calls = _batch_server(httpx.Response(503, text="unavailable"))
+    mock_api.post("/mcp").mock(side_effect=handler)
+
+    async with NerveClient(base_url="http://nerve-test:8088", api_key="test-key", transport=mock_transport) as client:
+        await client._ensure_session()
+        limit = client._limiter.limit
+        with pytest.raises(NerveError) as exc_info:
+            await client.batch(_REPLY_CALLS)
+        assert exc_info.value.code == 503
+        assert client._limiter.limit < limit
+        assert client._batch_supported is True
+        assert single_calls == []
+
+
+async def test_batch_fallback_is_consistent(mock_api, mock_transport):
+    """A rejected batch sends each call once, as later batches on the client do."""
+    handler, single_calls = _batch_server(httpx.Response(400, text="invalid json"))
+    mock_api.post("/mcp").mock(side_effect=handler)
+
+    async with NerveClient(base_url="http://nerve-test:8088", api_key="test-key", transport=mock_transport) as client:
+        first = await client.batch(_REPLY_CALLS)
+        assert sorted(single_calls) == ["get_thread", "send_reply"]
+        del single_calls[:]
+        assert await client.batch(_REPLY_CALLS) == first
+        assert sorted(single_calls) == ["get_thread", "send_reply"]
+        assert first == [args for _, args in _REPLY_CALLS]
+
+
+async def test_batch_rpc_error_keeps_batching(mock_api, mock_transport):
+    """A top-level JSON-RPC error other than -32600/-32700 is raised as is."""
+    error = {"jsonrpc": "2.0", "id": None, "error": {"code": -32000, "message": "boom"}}
+    handler, single_calls = _batch_server(
+        httpx.Response(200, content=orjson.dumps(error), headers=_JSON_HEADERS)
+    )
+    mock_api.post("/mcp").mock(side_effect=handler)
+
+    async with NerveClient(base_url="http://nerve-test:8088", api_key="test-key", transport=mock_transport) as client:
+        with pytest.raises(NerveError, match="boom"):
+            await client.batch(_REPLY_CALLS[:1])
+        assert client._batch_supported is True
+        assert single_calls == []
+
+
+async def test_batch_invalid_request_falls_back(mock_api, mock_transport):
+    """A -32600 reply to the batch disables batching on the client."""
+    error = {"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "Invalid Request"}}
+    handler, single_calls = _batch_server(
+        httpx.Response(200, content=orjson.dumps(error), headers=_JSON_HEADERS)
+    )
+    mock_api.post("/mcp").mock(side_effect=handler)
+
+    async with NerveClient(base_url="http://nerve-test:8088", api_key="test-key", transport=mock_transport) as client:
+        assert await client.batch(_REPLY_CALLS[:1]) == [{"thread_id": "t1"}]
+        assert client._batch_supported is False
+        assert single_calls == ["get_thread"]
+
+
+async def test_gather_tools_batches_idempotent_calls(mock_api, mock_transport):
+    """gather_tools batches idempotent calls, sends the rest singly, keeps order."""
+    handler, single_calls = _batch_server()
+    mock_api.post("/mcp").mock(side_effect=handler)
+    calls = [
+        ("get_thread", {"thread_id": "t1"}),
+        ("send_reply", {"thread_id": "t1", "body_text": "hi"}),
+        ("triage_message", {"message_id": "m1"}),
+        ("compose_email", {"to": "a@b.c"}),
+    ]
+
+    async with NerveClient(base_url="http://nerve-test:8088", api_key="test-key", transport=mock_transport) as client:
+        results = await client.gather_tools(calls)
+        assert results == [args for _, args in calls]
+        assert sorted(single_calls) == ["compose_email", "send_reply"]
+        assert client._batch_supported is True
+
+
+# --- Discovery caching ---
+
+
+async def test_list_tools_cached(mock_initialize, mock_transport):
+    """list_tools serves repeat calls from cache until invalidated."""
+    async with NerveClient(base_url="http://nerve-test:8088", api_key="test-key", transport=mock_transport) as client:
+        await client.list_tools()
+        calls = mock_initialize.calls.call_count
+        await client.list_tools()
+        assert mock_initialize.calls.call_count == calls
+
+        client.invalidate_tools_cache()
+        await client.list_tools()
+        assert mock_initialize.calls.call_count == calls + 1
+
+
+async def test_list_inboxes_cached(mock_initialize, mock_transport):
+    """list_inboxes serves copies from cache until invalidated."""
+    async with NerveClient(base_url="http://nerve-test:8088", api_key="test-key", transport=mock_transport) as client:
+        first = await client.list_inboxes()
+        calls = mock_initialize.calls.call_count
+        first["inbox_ids"] = None
+        second = await client.list_inboxes()
+        assert mock_initialize.calls.call_count == calls
+        assert second["inbox_ids"] is not None
+
+        client.invalidate_inboxes_cache()
+        await client.list_inboxes()
+        assert mock_initialize.calls.call_count == calls + 1
+
+
+async def test_list_inboxes_null_result(mock_api, mock_transport):
+    """A null resources/read result is returned as None and not cached."""
+    def handle_request(request: httpx.Request) -> httpx.Response:
+        body = orjson.loads(request.content)
+        return httpx.Response(
+            200,
+            content=orjson.dumps({"jsonrpc": "2.0", "id": body["id"], "result": None}),
+            headers={**_JSON_HEADERS, "MCP-Session-Id": "session-null"},
+        )
+
+    mock_api.post("/mcp").mock(side_effect=handle_request)
 
-# --- Tool methods ---
+    async with NerveClient(base_url="http://nerve-test:8088", api_key="test-key", transport=mock_transport) as client:
+        assert await client.list_inboxes() is None
+        assert client._inboxes_cache is None
 
 
-@pytest.mark.asyncio
-async def test_list_threads_sends_correct_rpc(mock_initialize):
-    """list_threads sends correct JSON-RPC with session and MCP-Protocol-Version header."""
-    async with NerveClient(base_url="http://nerve-test:8088", api_key="test-key") as client:
-        result = await client.list_threads(inbox_id="inbox_1", status="open", limit=20)
-        assert result["tool"] == "list_threads"
-        assert result["args"]["inbox_id"] == "inbox_1"
-        assert result["args"]["status"] == "open"
-        assert result["args"]["limit"] == 20
+async def test_list_inboxes_cache_expires(mock_initialize, mock_transport):
+    """With inboxes_cache_ttl=0 every call reads the resource again."""
+    async with NerveClient(
+        base_url="http://nerve-test:8088", api_key="test-key", inboxes_cache_ttl=0, transport=mock_transport
+    ) as client:
+        await client.list_inboxes()
+        calls = mock_initialize.calls.call_count
+        await client.list_inboxes()
+        assert mock_initialize.calls.call_count == calls + 1
 
 
-@pytest.mark.asyncio
-async def test_search_inbox(mock_initialize):
-    """search_inbox passes query and cursor correctly."""
-    async with NerveClient(base_url="http://nerve-test:8088", api_key="test-key") as client:
-        result = await client.search_inbox(inbox_id="inbox_1", query="refund", cursor="page2")
-        assert result["args"]["query"] == "refund"
-        assert result["args"]["cursor"] == "page2"
+# --- Streaming ---
 
 
-@pytest.mark.asyncio
-async def test_list_inboxes(mock_initialize):
-    """list_inboxes reads the email://inboxes resource."""
-    async with NerveClient(base_url="http://nerve-test:8088", api_key="test-key") as client:
-        result = await client.list_inboxes()
-        assert "inbox_ids" in result
+async def test_iter_thread_messages_streams_items(mcp_server, mock_transport):
+    """iter_thread_messages yields each message from result.messages."""
+    mcp_server.tool_result = {
+        "thread": {"ID": "t1"},
+        "messages": [{"ID": "m1", "score": 0.5}, {"ID": "m2", "To": [{"email": "a@b.c"}]}],
+    }
 
+    async with NerveClient(base_url="http://nerve-test:8088", api_key="test-key", transport=mock_transport) as client:
+        messages = [m async for m in client.iter_thread_messages("t1")]
+        assert messages == mcp_server.tool_result["messages"]
 
-@pytest.mark.asyncio
-async def test_health_check_true(mock_initialize):
-    """health_check returns True when server is reachable."""
-    async with NerveClient(base_url="http://nerve-test:8088", api_key="test-key") as client:
-        assert await client.health_check() is True
 
+async def test_iter_thread_messages_raises_rpc_error(mcp_server, mock_transport):
+    """JSON-RPC errors in the streamed response raise mapped exceptions."""
+    mcp_server.fail_next("tools/call", -32040, "Quota exceeded")
 
-@pytest.mark.asyncio
-async def test_health_check_false():
-    """health_check returns False on connection error."""
-    with respx.mock(base_url="http://nerve-test:8088") as mock:
-        mock.post("/mcp").mock(side_effect=httpx.ConnectError("Connection refused"))
+    async with NerveClient(base_url="http://nerve-test:8088", api_key="test-key", transport=mock_transport) as client:
+        with pytest.raises(NerveQuotaError):
+            async for _ in client.iter_thread_messages("t1"):
+                pass
 
-        async with NerveClient(base_url="http://nerve-test:8088", api_key="test-key") as client:
-            assert await client.health_check() is False
 
+async def test_iter_thread_messages_retries_rate_limit(mcp_server, mock_transport):
+    """A rate-limited stream backs off and retries like get_thread()."""
+    mcp_server.tool_result = {"thread": {"ID": "t1"}, "messages": [{"ID": "m1"}]}
+    mcp_server.fail_next("tools/call", -32042, "Rate limited", data={"retry_after_seconds": 0})
 
-@pytest.mark.asyncio
-async def test_context_manager_cleanup(mock_initialize):
-    """async with closes the HTTP client on exit."""
-    async with NerveClient(base_url="http://nerve-test:8088", api_key="test-key") as client:
-        await client.health_check()
-        http = client._http
-    # After exiting context, HTTP client should be closed
-    assert http.is_closed
+    async with NerveClient(base_url="http://nerve-test:8088", api_key="test-key", transport=mock_transport) as client:
+        limit = client._limiter.limit
+        messages = [m async for m in client.iter_thread_messages("t1")]
+        assert messages == [{"ID": "m1"}]
+        assert mcp_server.tools_call_count == 2
+        assert client._limiter.limit < limit
 
 
-@pytest.mark.asyncio
-async def test_list_tools(mock_initialize):
-    """list_tools returns server tool definitions."""
-    async with NerveClient(base_url="http://nerve-test:8088", api_key="test-key") as client:
-        tools = await client.list_tools()
-        assert len(tools) == 7
-        names = {t["name"] for t in tools}
-        assert "list_threads" in names
-        assert "send_reply" in names
+async def test_iter_thread_messages_session_expiry(mcp_server, mock_transport):
+    """An expired session is re-initialized before the stream is retried."""
+    mcp_server.tool_result = {"thread": {"ID": "t1"}, "messages": [{"ID": "m1"}]}
+    mcp_server.fail_next("tools/call", -32000, "Session expired")
+
+    async with NerveClient(base_url="http://nerve-test:8088", api_key="test-key", transport=mock_transport) as client:
+        assert [m async for m in client.iter_thread_messages("t1")] == [{"ID": "m1"}]
+        assert mcp_server.initialize_count == 2
+
+
+async def test_iter_thread_messages_releases_limiter_between_items(mcp_server, mock_transport):
+    """Client calls made inside the loop do not wait on the stream's slot."""
+    mcp_server.tool_result = {"thread": {"ID": "t1"}, "messages": [{"ID": "m1"}, {"ID": "m2"}]}
+
+    async with NerveClient(
+        base_url="http://nerve-test:8088", api_key="test-key", max_concurrency=1, transport=mock_transport
+    ) as client:
+        async def triage_each():
+            return [
+                await client.triage_message(message["ID"])
+                async for message in client.iter_thread_messages("t1")
+            ]
+
+        results = await asyncio.wait_for(triage_each(), timeout=2)
+        assert len(results) == 2
+        assert client._limiter.in_flight == 0
+
+
+async def test_iter_thread_messages_non_json_5xx(mock_api, mock_transport):
+    """A plain-text 5xx raises NerveError and shrinks the limiter."""
+    def handle_request(request: httpx.Request) -> httpx.Response:
+        body = orjson.loads(request.content)
+        if body["method"] == "initialize":
+            return httpx.Response(
+                200,
+                content=orjson.dumps({"jsonrpc": "2.0", "id": body["id"], "result": {}}),
+                headers={**_JSON_HEADERS, "MCP-Session-Id": "session-5xx"},
+            )
+        return httpx.Response(503, text="upstream unavailable")
+
+    mock_api.post("/mcp").mock(side_effect=handle_request)
+
+    async with NerveClient(base_url="http://nerve-test:8088", api_key="test-key", transport=mock_transport) as client:
+        limit = client._limiter.limit
+        with pytest.raises(NerveError) as exc_info:
+            async for _ in client.iter_thread_messages("t1"):
+                pass
+        assert exc_info.value.code == 503
+        assert client._limiter.limit < limit
+        assert client._limiter.in_flight == 0
@@ -0,0 +1,59 @@
+"""Unit tests for the AIMD concurrency limiter."""
+import asyncio
+
+import pytest
+
+from nerve_email.concurrency import AIMDLimiter
+
+
+def test_overload_shrinks_multiplicatively():
+    """Overload halves the limit, never below min_limit."""
+    limiter = AIMDLimiter(initial_limit=8, min_limit=1)
+    limiter.on_overload()
+    assert limiter.limit == 4
+    for _ in range(10):
+        limiter.on_overload()
+    assert limiter.limit == 1
+
+
+def test_fast_success_grows_additively():
+    """Successes under target latency grow the limit up to max_limit."""
+    limiter = AIMDLimiter(initial_limit=2, max_limit=4, target_latency=1.0)
+    for _ in range(100):
+        limiter.on_success(0.01)
+    assert limiter.limit == 4
+
+
+def test_slow_success_holds_limit():
+    """Successes above target latency do not grow the limit."""
+    limiter = AIMDLimiter(initial_limit=2, target_latency=1.0)
+    for _ in range(100):
+        limiter.on_success(5.0)
+    assert limiter.limit == 2
+
+
+async def test_acquire_blocks_at_limit():
+    """Callers beyond the limit wait until a slot is released."""
+    limiter = AIMDLimiter(initial_limit=1)
+    await limiter.acquire()
+    waiter = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    limiter.release()
+    await asyncio.wait_for(waiter, timeout=1)
+    assert limiter.in_flight == 1
+
+
+async def test_cancelled_waiter_released_before_resuming():
+    """A waiter cancelled and then passed over by release() still raises CancelledError."""
+    limiter = AIMDLimiter(initial_limit=1)
+    await limiter.acquire()
+    waiter = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0)
+
+    waiter.cancel()
+    limiter.release()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert limiter.in_flight == 0
@@ -0,0 +1,25 @@
+"""Unit tests for the SDK exception taxonomy."""
+import pickle
+
+from nerve_email.exceptions import NerveError, NerveQuotaError, NerveRateLimitError
+
+
+def test_str_returns_message():
+    """str() returns the message, including class defaults."""
+    assert str(NerveError("boom", code=7)) == "boom"
+    assert str(NerveQuotaError()) == "Quota exceeded"
+
+
+def test_pickle_round_trip_keeps_fields():
+    """Slot attributes survive pickling."""
+    err = pickle.loads(pickle.dumps(NerveRateLimitError("slow down", retry_after=5)))
+    assert str(err) == "slow down"
+    assert err.code == -32042
+    assert err.retry_after == 5
+
+
+def test_pickle_round_trip_keyword_constructed():
+    """Errors built with keyword arguments unpickle too."""
+    err = pickle.loads(pickle.dumps(NerveError(message="x", code=3)))
+    assert str(err) == "x"
+    assert err.code == 3
@@ -7,95 +7,127 @@ from nerve_email.tools import (
     get_tool_definitions,
 )
 
-
-def test_nerve_tools_has_7_definitions():
-    """SDK defines exactly 7 email tools."""
-    assert len(NERVE_TOOLS) == 7
+_EXPECTED_NAMES = frozenset((
+    "list_threads", "get_thread", "search_inbox",
+    "triage_message", "extract_to_schema",
+    "draft_reply_with_policy", "send_reply", "compose_email",
+))
+_TOOLS_SNAPSHOT = tuple((tool, tool.parameters) for tool in NERVE_TOOLS.values())
+_CLAUDE_KEYS = frozenset(("name", "description", "input_schema"))
+_OPENAI_KEYS = frozenset(("type", "function"))
+_FUNCTION_KEYS = frozenset(("name", "description", "parameters"))  # OpenAI function body, raw
+_CLAUDE_REQUIRED = {
+    t["name"]: frozenset(t["input_schema"].get("required", ()))
+    for t in get_tool_definitions(format="claude")
+}
+
+
+def test_nerve_tools_has_8_definitions():
+    """SDK defines exactly 8 email tools."""
+    assert len(NERVE_TOOLS) == 8
 
 
 def test_all_tools_have_required_fields():
     """Every tool definition has name, description, and parameters."""
-    for name, tool in NERVE_TOOLS.items():
+    assert all(tool.name == name for name, tool in NERVE_TOOLS.items())
+    for tool, params in _TOOLS_SNAPSHOT:
         assert isinstance(tool, ToolDefinition)
-        assert tool.name == name
         assert tool.description
-        assert tool.parameters.get("type") == "object"
-        assert "properties" in tool.parameters
+        assert params["type"] == "object"
+        assert "properties" in params
+
+
+def _openai_function(tool):
+    assert tool.keys() >= _OPENAI_KEYS
+    assert tool["type"] == "function"
+    return tool["function"]
+
+
+def _identity(tool):
+    return tool
+
+
+def _assert_shape(definition: dict, prefix: str, schema_key: str, keys: frozenset):
+    """One tool definition: expected keys, prefixed name, description, object schema."""
+    assert definition.keys() >= keys
+    assert definition["name"].startswith(prefix)
+    assert definition["description"]
+    assert definition[schema_key]["type"] == "object"
+
+
+@pytest.mark.parametrize(
+    "fmt,prefix,unwrap,schema_key,keys",
+    [
+        ("claude", "", _identity, "input_schema", _CLAUDE_KEYS),
+        ("claude", "email_", _identity, "input_schema", _CLAUDE_KEYS),
+        ("openai", "", _openai_function, "parameters", _FUNCTION_KEYS),
+        ("openai", "email_", _openai_function, "parameters", _FUNCTION_KEYS),
+        ("raw", "", _identity, "parameters", _FUNCTION_KEYS),
+    ],
+    ids=["claude", "claude-prefix", "openai", "openai-prefix", "raw"],
+)
+def test_format(tool_defs, fmt, prefix, unwrap, schema_key, keys):
+    """Each format carries name (with prefix), description and an object schema."""
+    for tool in tool_defs[fmt, prefix]:
+        _assert_shape(unwrap(tool), prefix, schema_key, keys)
+
+
+@pytest.mark.parametrize("fmt", ["claude", "openai", "raw"])
+def test_length(tool_defs, fmt):
+    """Every format emits one definition per tool."""
+    assert len(tool_defs[fmt, ""]) == len(NERVE_TOOLS)
+
+
+def test_get_tool_definitions_is_cached():
+    """shared=True reuses the memoized per-tool dicts in a fresh list."""
+    first = get_tool_definitions(format="claude", prefix="email_", shared=True)
+    second = get_tool_definitions(format="claude", prefix="email_", shared=True)
+    assert first is not second
+    assert all(a is b for a, b in zip(first, second))
 
 
-def test_claude_format():
-    """Claude format has name, description, input_schema."""
+def test_default_result_is_private_copy():
+    """Mutating the default result leaks into neither later calls nor NERVE_TOOLS."""
     tools = get_tool_definitions(format="claude")
-    assert len(tools) == 7
-    for tool in tools:
-        assert "name" in tool
-        assert "description" in tool
-        assert "input_schema" in tool
-        assert tool["input_schema"]["type"] == "object"
-
-
-def test_claude_format_with_prefix():
-    """Prefix is added to all tool names."""
-    tools = get_tool_definitions(format="claude", prefix="email_")
-    for tool in tools:
-        assert tool["name"].startswith("email_")
-
-
-def test_openai_format():
-    """OpenAI format has type=function and function dict."""
-    tools = get_tool_definitions(format="openai")
-    assert len(tools) == 7
-    for tool in tools:
-        assert tool["type"] == "function"
-        assert "function" in tool
-        func = tool["function"]
-        assert "name" in func
-        assert "description" in func
-        assert "parameters" in func
-
-
-def test_openai_format_with_prefix():
-    """OpenAI format respects prefix."""
-    tools = get_tool_definitions(format="openai", prefix="email_")
-    for tool in tools:
-        assert tool["function"]["name"].startswith("email_")
-
-
-def test_raw_format():
-    """Raw format returns name, description, parameters."""
-    tools = get_tool_definitions(format="raw")
-    assert len(tools) == 7
-    for tool in tools:
-        assert "name" in tool
-        assert "description" in tool
-        assert "parameters" in tool
+    tools[-1]["cache_control"] = {"type": "ephemeral"}
+    tools[1]["input_schema"]["properties"]["x"] = {"type": "string"}
+
+    fresh = get_tool_definitions(format="claude")
+    assert "cache_control" not in fresh[-1]
+    assert "x" not in fresh[1]["input_schema"]["properties"]
+    assert "x" not in get_tool_definitions(format="openai", shared=True)[1]["function"]["parameters"]["properties"]
+    assert "x" not in NERVE_TOOLS[fresh[1]["name"]].parameters["properties"]
+
+
+def test_shared_result_does_not_alias_nerve_tools():
+    """Cached schemas are built from copies, so NERVE_TOOLS stays intact."""
+    shared = get_tool_definitions(format="raw", shared=True)
+    for definition in shared:
+        tool = NERVE_TOOLS[definition["name"]]
+        assert definition["parameters"] is not tool.parameters
+        assert definition["parameters"]["properties"] is not tool.parameters["properties"]
 
 
 def test_unknown_format_raises():
     """Unknown format raises ValueError."""
-    with pytest.raises(ValueError, match="Unknown format"):
+    try:
         get_tool_definitions(format="langchain")
+    except ValueError as e:
+        assert "Unknown format" in str(e)
+    else:
+        pytest.fail("ValueError not raised")
 
 
 def test_required_fields_propagated():
     """Required fields from ToolDefinition appear in output schemas."""
-    claude_tools = get_tool_definitions(format="claude")
-    tool_map = {t["name"]: t for t in claude_tools}
-
     # list_threads requires inbox_id
-    assert "inbox_id" in tool_map["list_threads"]["input_schema"]["required"]
+    assert "inbox_id" in _CLAUDE_REQUIRED["list_threads"]
 
     # send_reply requires thread_id and body_or_draft_id
-    send = tool_map["send_reply"]["input_schema"]["required"]
-    assert "thread_id" in send
-    assert "body_or_draft_id" in send
+    assert "thread_id" in _CLAUDE_REQUIRED["send_reply"]
+    assert "body_or_draft_id" in _CLAUDE_REQUIRED["send_reply"]
 
 
 def test_tool_names_are_stable():
     """Tool names match expected values (prevent accidental renames)."""
-    expected = {
-        "list_threads", "get_thread", "search_inbox",
-        "triage_message", "extract_to_schema",
-        "draft_reply_with_policy", "send_reply",
-    }
-    assert set(NERVE_TOOLS.keys()) == expected
+    assert NERVE_TOOLS.keys() == _EXPECTED_NAMES
@@ -0,0 +1,62 @@
+"""Unit tests for the lightweight response types and decode()."""
+from typing import List
+
+import orjson
+import pytest
+
+from nerve_email import types_fast
+from nerve_email.types_fast import EmailAddress, Message, SearchResult, Thread, decode
+
+_THREAD = {
+    "id": "t1",
+    "subject": "Hello",
+    "message_count": 2,
+    "messages": [
+        {
+            "id": "m1",
+            "thread_id": "t1",
+            "from_": {"address": "a@example.com", "name": "A"},
+            "to": [{"address": "b@example.com"}],
+            "body_text": "hi",
+        },
+        {"id": "m2", "thread_id": "t1"},
+    ],
+}
+_SEARCH_RESULTS = [
+    {"message_id": "m1", "thread_id": "t1", "score": 1},
+    {"message_id": "m2", "thread_id": "t1", "snippet": "...", "score": 0.5},
+]
+
+
+@pytest.fixture(params=["msgspec", "orjson"])
+def decode_path(request, monkeypatch):
+    """Run a test against both decode() implementations."""
+    if request.param == "msgspec":
+        pytest.importorskip("msgspec")
+    else:
+        monkeypatch.setattr(types_fast, "msgspec", None)
+    return request.param
+
+
+def test_from_dict_fast_builds_nested_types():
+    thread = Thread.from_dict_fast(_THREAD)
+    first, second = thread.messages
+    assert thread.subject == "Hello" and thread.status is None
+    assert first.from_ == EmailAddress("a@example.com", "A")
+    assert first.to == [EmailAddress("b@example.com")]
+    assert first.body_text == "hi"
+    assert second == Message("m2", "t1")
+
+
+def test_decode_thread(decode_path):
+    assert decode(orjson.dumps(_THREAD), Thread) == Thread.from_dict_fast(_THREAD)
+
+
+def test_decode_list(decode_path):
+    results = decode(orjson.dumps(_SEARCH_RESULTS), List[SearchResult])
+    assert [r.message_id for r in results] == ["m1", "m2"]
+    assert results[1].snippet == "..."
+    # msgspec coerces an integral score to float; the fallback keeps the
+    # JSON value as is
+    assert type(results[0].score) is (float if decode_path == "msgspec" else int)
+    assert results[0].score == 1